@@ -13,6 +13,20 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+# Static section of the summary report, built once at import
+FEATURES_SUMMARY = (
+    "Features Successfully Demonstrated:\n"
+    "✅ Basic simulator operations\n"
+    "✅ App lifecycle management\n"
+    "✅ Core app navigation\n"
+    "✅ Media import and Photos app\n"
+    "✅ Location simulation with Maps\n"
+    "✅ Web browsing with Safari\n"
+    "✅ Appearance mode switching\n"
+    "✅ Privacy permissions\n"
+    "✅ Push notifications\n\n"
+)
+
 class AutomatedSimulatorDemo:
     """Fully automated iOS Simulator demonstration."""
     
@@ -34,10 +48,11 @@ class AutomatedSimulatorDemo:
         with open(self.log_file, 'a') as f:
             f.write(log_message + "\n")
     
-    def run_command(self, cmd, silent=False, ignore_errors=False):
+    def run_command(self, cmd, silent=False, ignore_errors=False, timeout=None):
         """Execute a shell command."""
         try:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True,
+                                    timeout=timeout)
             if not silent:
                 self.log(f"Command executed: {cmd.split()[0]}...", "DEBUG")
             return result.stdout
@@ -129,17 +144,14 @@ class AutomatedSimulatorDemo:
         if best_device['state'] != 'Booted':
             self.log("📲 Booting simulator...", "INFO")
             self.run_command(f"{self.simctl} boot {self.selected_udid}")
-            time.sleep(5)
+            self.wait_for_boot()
             
             # Open Simulator app
             self.run_command("open -a Simulator")
-            time.sleep(3)
+            self.wait_for_springboard()
             self.log("✅ Simulator booted and ready", "SUCCESS")
         else:
             self.log("✅ Simulator already booted", "SUCCESS")
-        
-        # Extra wait for stability
-        time.sleep(2)
     
     def demonstrate_basic_operations(self):
         """Basic simulator operations."""
@@ -351,8 +363,7 @@ class AutomatedSimulatorDemo:
             }
             
             push_file = self.demo_dir / "push.json"
-            with open(push_file, 'w') as f:
-                json.dump(push_data, f)
+            push_file.write_text(json.dumps(push_data))
             
             self.run_command(f"{self.simctl} push {self.selected_udid} com.apple.Preferences '{push_file}'", 
                            ignore_errors=True, silent=True)
@@ -397,8 +408,9 @@ class AutomatedSimulatorDemo:
         """Generate a summary report of the demo."""
         self.log("\n📊 Generating summary report...", "STEP")
         
-        # Count screenshots
-        screenshots = list(self.demo_dir.glob("*.png"))
+        # Count screenshots in a single directory pass
+        with os.scandir(self.demo_dir) as entries:
+            screenshots = [entry.name for entry in entries if entry.name.endswith('.png')]
         
         # Calculate duration
         duration = datetime.now() - self.start_time
@@ -414,16 +426,7 @@ class AutomatedSimulatorDemo:
             f.write(f"Screenshots taken: {len(screenshots)}\n")
             f.write(f"Skipped operations: {len(self.failed_operations)}\n\n")
             
-            f.write("Features Successfully Demonstrated:\n")
-            f.write("✅ Basic simulator operations\n")
-            f.write("✅ App lifecycle management\n")
-            f.write("✅ Core app navigation\n")
-            f.write("✅ Media import and Photos app\n")
-            f.write("✅ Location simulation with Maps\n")
-            f.write("✅ Web browsing with Safari\n")
-            f.write("✅ Appearance mode switching\n")
-            f.write("✅ Privacy permissions\n")
-            f.write("✅ Push notifications\n\n")
+            f.write(FEATURES_SUMMARY)
             
             if self.failed_operations:
                 f.write("Skipped Operations:\n")
@@ -433,7 +436,7 @@ class AutomatedSimulatorDemo:
             
             f.write("Output Files:\n")
             for screenshot in sorted(screenshots):
-                f.write(f"- {screenshot.name}\n")
+                f.write(f"- {screenshot}\n")
             
             f.write(f"\nLog file: {self.log_file.name}\n")
         
@@ -452,6 +455,57 @@ class AutomatedSimulatorDemo:
             self.log(f"⚠️  Screenshot failed: {e}", "WARNING")
             self.failed_operations.append(f"Screenshot: {name}")
     
+    def wait_for_boot(self, timeout=120):
+        """Block until the selected simulator has finished booting."""
+        try:
+            self.run_command(f"{self.simctl} bootstatus {self.selected_udid} -b",
+                             silent=True, timeout=timeout)
+            return
+        except subprocess.TimeoutExpired as e:
+            # bootstatus already waited the full timeout; polling would only double it
+            raise Exception("Timeout waiting for simulator to boot") from e
+        except subprocess.CalledProcessError:
+            self.log("bootstatus unavailable, polling device state", "DEBUG")
+        
+        # Fallback: poll with exponential backoff bounded by a deadline
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            if self._is_booted():
+                return
+            delay = min(delay * 2, 1.0)
+        
+        raise Exception("Timeout waiting for simulator to boot")
+    
+    def wait_for_springboard(self, timeout=15):
+        """Wait until SpringBoard is running so the home screen can take input."""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            output = self.run_command(f"{self.simctl} spawn {self.selected_udid} launchctl list",
+                                      silent=True, ignore_errors=True)
+            for line in (output or "").splitlines():
+                pid, _, label = line.partition("\t")
+                if pid.isdigit() and "springboard" in label.lower():
+                    return
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        
+        self.log("⚠️  SpringBoard not reported running, continuing anyway", "WARNING")
+    
+    def _is_booted(self):
+        """Check whether the selected simulator reports the Booted state."""
+        output = self.run_command(f"{self.simctl} list devices booted -j",
+                                  silent=True, ignore_errors=True)
+        if not output:
+            return False
+        
+        data = json.loads(output)
+        return any(device['udid'] == self.selected_udid
+                   for devices in data['devices'].values()
+                   for device in devices)
+    
     def create_sample_image(self):
         """Create a sample image for media demo."""
         try:
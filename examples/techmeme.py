@@ -7,24 +7,34 @@ Opens Techmeme.com in Safari and captures screenshots of the latest tech news.
 """
 
 import subprocess
-import json
 import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+TECHMEME_URL = "https://techmeme.com"
+STATUS_BAR_OVERRIDES = [
+    "--time", "9:41", "--batteryLevel", "100", "--cellularBars", "4", "--wifiBars", "3"
+]
+
 class TechmemeNewsCapture:
     """Capture latest news from Techmeme in Safari."""
     
     def __init__(self):
-        self.simctl = "xcrun simctl"
+        self.simctl = ["xcrun", "simctl"]
         self.output_dir = Path("techmeme_news")
         self.output_dir.mkdir(exist_ok=True)
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.started_at = datetime.now()
+        self.timestamp = self.started_at.strftime("%Y%m%d_%H%M%S")
     
-    def run_command(self, cmd, ignore_errors=False):
-        """Execute a shell command."""
+    def run_command(self, args, ignore_errors=False):
+        """Execute a command given as an argument list (no shell)."""
         try:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
+            result = subprocess.run(args, capture_output=True, text=True, check=True)
             return result.stdout
         except subprocess.CalledProcessError as e:
             if not ignore_errors:
@@ -34,8 +44,8 @@ class TechmemeNewsCapture:
     
     def get_booted_simulator(self):
         """Find the currently booted simulator."""
-        output = self.run_command(f"{self.simctl} list devices -j")
-        data = json.loads(output)
+        output = self.run_command([*self.simctl, "list", "devices", "-j"])
+        data = json_loads(output)
         
         for runtime, devices in data['devices'].items():
             for device in devices:
@@ -48,7 +58,7 @@ class TechmemeNewsCapture:
         """Take a screenshot with timestamp."""
         filename = f"{self.timestamp}_{name}.png"
         path = self.output_dir / filename
-        self.run_command(f"{self.simctl} io {udid} screenshot '{path}'")
+        self.run_command([*self.simctl, "io", udid, "screenshot", str(path)])
         print(f"📸 Captured: {description} → {filename}")
         return path
     
@@ -72,17 +82,17 @@ class TechmemeNewsCapture:
         try:
             # Close any existing Safari instances
             print("🧹 Closing existing Safari instances...")
-            self.run_command(f"{self.simctl} terminate {udid} com.apple.mobilesafari", ignore_errors=True)
+            self.run_command([*self.simctl, "terminate", udid, "com.apple.mobilesafari"],
+                             ignore_errors=True)
             time.sleep(1)
             
             # Set demo status bar for clean screenshots
             print("📶 Setting clean status bar...")
-            self.run_command(f"{self.simctl} status_bar {udid} override "
-                           "--time '9:41' --batteryLevel 100 --cellularBars 4 --wifiBars 3")
+            self.run_command([*self.simctl, "status_bar", udid, "override", *STATUS_BAR_OVERRIDES])
             
             # Open Techmeme
             print("🌐 Opening Techmeme.com...")
-            self.run_command(f"{self.simctl} openurl {udid} 'https://techmeme.com'")
+            self.run_command([*self.simctl, "openurl", udid, TECHMEME_URL])
             
             # Wait for page to load
             print("⏳ Waiting for page to load...")
@@ -128,7 +138,7 @@ class TechmemeNewsCapture:
             
             # Clear status bar
             print("\n🧹 Cleaning up...")
-            self.run_command(f"{self.simctl} status_bar {udid} clear")
+            self.run_command([*self.simctl, "status_bar", udid, "clear"])
             
             # Summary
             print("\n✅ Capture complete!")
@@ -142,30 +152,32 @@ class TechmemeNewsCapture:
                 print(f"   - {screenshot.name}")
             
             # Generate summary
-            self.generate_summary()
+            self.generate_summary(screenshots)
             
         except KeyboardInterrupt:
             print("\n\n⚠️  Capture interrupted")
         except Exception as e:
             print(f"\n❌ Error: {e}")
     
-    def generate_summary(self):
+    def generate_summary(self, screenshots=None):
         """Generate a summary of the capture session."""
         summary_file = self.output_dir / f"{self.timestamp}_summary.txt"
         
-        with open(summary_file, 'w') as f:
-            f.write("Techmeme News Capture Summary\n")
-            f.write("=" * 40 + "\n\n")
-            f.write(f"Capture Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Website: https://techmeme.com\n\n")
-            
-            f.write("Screenshots captured:\n")
+        if screenshots is None:
             screenshots = list(self.output_dir.glob(f"{self.timestamp}_*.png"))
-            for screenshot in sorted(screenshots):
-                f.write(f"- {screenshot.name}\n")
-            
-            f.write(f"\nTotal screenshots: {len(screenshots)}\n")
-            f.write(f"Output directory: {self.output_dir.absolute()}\n")
+        
+        lines = [
+            "Techmeme News Capture Summary\n",
+            "=" * 40 + "\n\n",
+            f"Capture Date: {self.started_at:%Y-%m-%d %H:%M:%S}\n",
+            f"Website: https://techmeme.com\n\n",
+            "Screenshots captured:\n",
+        ]
+        lines.extend(f"- {screenshot.name}\n" for screenshot in sorted(screenshots))
+        lines.append(f"\nTotal screenshots: {len(screenshots)}\n")
+        lines.append(f"Output directory: {self.output_dir.absolute()}\n")
+        
+        summary_file.write_text("".join(lines))
         
         print(f"\n📄 Summary saved: {summary_file.name}")
 
@@ -186,15 +198,15 @@ def automated_capture():
     
     try:
         # Setup
-        capture.run_command(f"{capture.simctl} terminate {udid} com.apple.mobilesafari", ignore_errors=True)
+        capture.run_command([*capture.simctl, "terminate", udid, "com.apple.mobilesafari"],
+                            ignore_errors=True)
         time.sleep(1)
         
-        capture.run_command(f"{capture.simctl} status_bar {udid} override "
-                          "--time '9:41' --batteryLevel 100 --cellularBars 4 --wifiBars 3")
+        capture.run_command([*capture.simctl, "status_bar", udid, "override", *STATUS_BAR_OVERRIDES])
         
         # Open Techmeme
         print("🌐 Opening Techmeme.com...")
-        capture.run_command(f"{capture.simctl} openurl {udid} 'https://techmeme.com'")
+        capture.run_command([*capture.simctl, "openurl", udid, TECHMEME_URL])
         
         # Wait for load
         print("⏳ Waiting for page load...")
@@ -218,7 +230,7 @@ def automated_capture():
         capture.take_screenshot(udid, "04_final_state", "Techmeme - Final state")
         
         # Cleanup
-        capture.run_command(f"{capture.simctl} status_bar {udid} clear")
+        capture.run_command([*capture.simctl, "status_bar", udid, "clear"])
         
         print("\n✅ Automated capture complete!")
         print(f"📁 Screenshots saved to: {capture.output_dir}")
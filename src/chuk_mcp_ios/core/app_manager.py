@@ -95,13 +95,16 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
         # Extract app info
         app_info = self._extract_app_info(app_path)
         
-        # Check if already installed
-        if config.skip_if_installed and self.is_app_installed(udid, app_info.bundle_id):
+        # Check installed state once for both options
+        installed = ((config.skip_if_installed or config.force_reinstall) and
+                     self.is_app_installed(udid, app_info.bundle_id))
+        
+        if config.skip_if_installed and installed:
             print(f"App {app_info.name} already installed, skipping")
             return app_info
         
         # Force reinstall if requested
-        if config.force_reinstall and self.is_app_installed(udid, app_info.bundle_id):
+        if config.force_reinstall and installed:
             print(f"Force reinstalling {app_info.name}...")
             self.uninstall_app(udid, app_info.bundle_id)
         
@@ -300,8 +303,9 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
         
         try:
             if device.device_type == DeviceType.SIMULATOR:
-                # Use simctl for simulators
-                result = self.run_command(f"{self.simctl_path} spawn {udid} launchctl list | grep {bundle_id}")
+                # Use simctl for simulators; match in-process rather than piping through grep
+                result = self.run_command([*self.simctl_args, "spawn", udid, "launchctl", "list"],
+                                          show_errors=False)
                 return bundle_id in result.stdout
             else:
                 # Use idb for real devices
@@ -409,15 +413,6 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
         """Extract info from .app bundle."""
         info_plist_path = os.path.join(app_path, 'Info.plist')
         
-        if not os.path.exists(info_plist_path):
-            # Fallback info
-            app_name = os.path.basename(app_path).replace('.app', '')
-            return AppInfo(
-                bundle_id=f"com.unknown.{app_name.lower()}",
-                name=app_name,
-                version="1.0"
-            )
-        
         try:
             with open(info_plist_path, 'rb') as f:
                 plist_data = plistlib.load(f)
@@ -431,7 +426,9 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
                 installed_path=app_path
             )
         except Exception as e:
-            print(f"Warning: Could not read Info.plist: {e}")
+            # A missing Info.plist (open() raises) falls back silently, as before
+            if not isinstance(e, FileNotFoundError):
+                print(f"Warning: Could not read Info.plist: {e}")
             app_name = os.path.basename(app_path).replace('.app', '')
             return AppInfo(
                 bundle_id=f"com.unknown.{app_name.lower()}",
@@ -505,11 +502,8 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
     def _launch_simulator_app(self, udid: str, bundle_id: str, arguments: Optional[List[str]]):
         """Launch app on simulator."""
         try:
-            command = f"{self.simctl_path} launch {udid} {bundle_id}"
-            if arguments:
-                args_str = ' '.join([f'"{arg}"' for arg in arguments])
-                command += f" {args_str}"
-            self.run_command(command)
+            # Built in one expression as an argv list: no shell quoting of arguments
+            self.run_command([*self.simctl_args, "launch", udid, bundle_id, *(arguments or ())])
         except Exception as e:
             raise DeviceError(f"Failed to launch app on simulator: {e}")
     
@@ -528,16 +522,23 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
         device_data_path = os.path.expanduser(f"~/Library/Developer/CoreSimulator/Devices/{udid}/data")
         containers_path = os.path.join(device_data_path, "Containers/Bundle/Application")
         
-        if os.path.exists(containers_path):
-            for app_dir in os.listdir(containers_path):
-                app_path = os.path.join(containers_path, app_dir)
-                
-                # Find .app bundle
-                for item in os.listdir(app_path):
-                    if item.endswith('.app'):
-                        full_app_path = os.path.join(app_path, item)
+        # scandir entries carry the joined path and the dirent type, so there is
+        # no per-entry os.path.join or stat (and stray files are skipped)
+        try:
+            containers = list(os.scandir(containers_path))
+        except FileNotFoundError:
+            return apps
+        
+        for app_dir in containers:
+            if not app_dir.is_dir():
+                continue
+            
+            # Find .app bundle
+            with os.scandir(app_dir.path) as items:
+                for item in items:
+                    if item.name.endswith('.app'):
                         try:
-                            app_info = self._extract_app_bundle_info(full_app_path)
+                            app_info = self._extract_app_bundle_info(item.path)
                             apps.append(app_info)
                         except:
                             pass
@@ -572,10 +573,9 @@ class UnifiedAppManager(CommandExecutor, AppManagerInterface):
         """Launch app on real device."""
         try:
             if self.idb_path:
-                command = f"{self.idb_path} launch --udid {udid} {bundle_id}"
+                command = [self.idb_path, "launch", "--udid", udid, bundle_id]
                 if arguments:
-                    args_str = ' '.join([f'"{arg}"' for arg in arguments])
-                    command += f" -- {args_str}"
+                    command += ["--", *arguments]
                 self.run_command(command)
             else:
                 raise DeviceError("idb not available for real device app launch")
@@ -5,7 +5,10 @@ Core base classes and interfaces for iOS device control.
 Device-agnostic abstractions that work for both simulators and real devices.
 """
 
+import asyncio
+import shutil
 import subprocess
+from functools import lru_cache
 from typing import List, Dict, Optional, Union, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -25,6 +28,9 @@ class DeviceState(Enum):
     SHUTDOWN = "shutdown"
     UNKNOWN = "unknown"
 
+# States in which a device can be driven (booted simulator / connected device)
+AVAILABLE_STATES = frozenset({DeviceState.BOOTED, DeviceState.CONNECTED})
+
 # Data Models
 @dataclass
 class DeviceInfo:
@@ -56,41 +62,102 @@ class SessionInfo:
     created_at: datetime
     metadata: Dict = None
 
+@lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """Resolve a command name to an absolute path (falls back to the name)."""
+    return shutil.which(name) or name
+
 # Base Executor
 class CommandExecutor:
     """Base class for executing shell commands with error handling."""
     
     def __init__(self):
         self.simctl_path = "xcrun simctl"
+        self.simctl_args = ["xcrun", "simctl"]
         self.idb_path = "idb"
         self.devicectl_path = "xcrun devicectl"
     
-    def run_command(self, command: str, timeout: Optional[int] = None, 
-                   show_errors: bool = True) -> subprocess.CompletedProcess:
-        """Execute a shell command and return the result."""
+    def run_command(self, command: Union[str, List[str]], timeout: Optional[int] = None, 
+                   show_errors: bool = True, text: bool = True,
+                   input_data: Optional[Union[str, bytes]] = None) -> subprocess.CompletedProcess:
+        """
+        Execute a command and return the result.
+        
+        A string is run through the shell. An argument list is executed
+        directly, which avoids spawning /bin/sh and any quoting issues.
+        Pass text=False to capture binary output (e.g. images on stdout),
+        and input_data to feed the command's stdin.
+        """
+        if isinstance(command, str):
+            shell = True
+            args = command
+            display = command
+        else:
+            # Absolute executable + close_fds=False lets CPython use posix_spawn
+            shell = False
+            args = [resolve_executable(command[0]), *command[1:]]
+            display = ' '.join(command)
+        
         try:
             result = subprocess.run(
-                command, 
-                shell=True, 
+                args, 
+                shell=shell, 
                 capture_output=True, 
-                text=True, 
+                text=text, 
+                input=input_data,
                 check=True,
-                timeout=timeout
+                timeout=timeout,
+                close_fds=shell
             )
             return result
         except subprocess.CalledProcessError as e:
             if show_errors:
-                print(f"Error executing command: {command}")
+                print(f"Error executing command: {display}")
                 print(f"Error: {e.stderr}")
             raise e
         except subprocess.TimeoutExpired as e:
             if show_errors:
-                print(f"Command timed out: {command}")
+                print(f"Command timed out: {display}")
             raise e
         except FileNotFoundError as e:
             if show_errors:
-                print(f"Command not found: {command}")
+                print(f"Command not found: {display}")
+            raise e
+    
+    async def run_command_async(self, args: List[str], timeout: Optional[int] = None,
+                                show_errors: bool = True) -> subprocess.CompletedProcess:
+        """Execute a command (argument list, no shell) without blocking the event loop."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError as e:
+            if show_errors:
+                print(f"Command not found: {args[0]}")
             raise e
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            if show_errors:
+                print(f"Command timed out: {' '.join(args)}")
+            raise subprocess.TimeoutExpired(args, timeout)
+        
+        result = subprocess.CompletedProcess(
+            args, process.returncode, stdout.decode(), stderr.decode()
+        )
+        if result.returncode != 0:
+            if show_errors:
+                print(f"Error executing command: {' '.join(args)}")
+                print(f"Error: {result.stderr}")
+            raise subprocess.CalledProcessError(
+                result.returncode, args, result.stdout, result.stderr
+            )
+        return result
 
 # Abstract Interfaces
 class DeviceControllerInterface(ABC):
@@ -209,6 +276,12 @@ class SessionError(DeviceError):
 # Utility Functions
 def detect_available_tools() -> Dict[str, bool]:
     """Detect which tools are available on the system."""
+    # Probing spawns several processes; every manager calls this on construction
+    return dict(_probe_available_tools())
+
+@lru_cache(maxsize=1)
+def _probe_available_tools() -> Dict[str, bool]:
+    """Probe for tools once per process."""
     tools = {
         'simctl': False,
         'idb': False,
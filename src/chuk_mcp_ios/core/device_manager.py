@@ -6,6 +6,10 @@ Unified device manager that handles both simulators and real iOS devices.
 
 import json
 import time
+import asyncio
+import threading
+import subprocess
+from dataclasses import replace
 from typing import List, Optional, Dict, Any
 from .base import (
     DeviceControllerInterface,
@@ -14,12 +18,40 @@ from .base import (
     DeviceInfo,
     DeviceType,
     DeviceState,
+    AVAILABLE_STATES,
     DeviceNotFoundError,
     DeviceNotAvailableError,
     detect_available_tools,
     format_device_info
 )
 
+# Capability sets by device type (copied per call so callers may mutate them)
+SIMULATOR_CAPABILITIES = {
+    'can_install_apps': True,
+    'can_simulate_location': True,
+    'can_add_media': True,
+    'can_clear_keychain': True,
+    'can_erase_device': True,
+    'can_change_settings': True,
+    'requires_developer_profile': False,
+    'supports_debugging': True,
+    'supports_ui_automation': True,
+    'supports_performance_monitoring': True
+}
+
+REAL_DEVICE_CAPABILITIES = {
+    'can_install_apps': True,  # With developer profile
+    'can_simulate_location': True,
+    'can_add_media': True,
+    'can_clear_keychain': False,
+    'can_erase_device': False,
+    'can_change_settings': False,
+    'requires_developer_profile': True,
+    'supports_debugging': True,
+    'supports_ui_automation': True,
+    'supports_performance_monitoring': True
+}
+
 class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
     """
     Unified device manager supporting both iOS simulators and real devices.
@@ -30,6 +62,8 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
         super().__init__()
         self.available_tools = detect_available_tools()
         self._device_cache = {}
+        self._devices_by_udid: Dict[str, DeviceInfo] = {}
+        self._boot_locks: Dict[str, threading.Lock] = {}
         self._cache_timeout = 30
         self._last_cache_time = 0
         
@@ -38,8 +72,8 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
         self.real_device_manager = None
         
         if self.available_tools['simctl']:
-            from ..devices.simulator import SimulatorManager
-            self.simulator_manager = SimulatorManager()
+            from ..devices.simulator import get_simulator_manager
+            self.simulator_manager = get_simulator_manager()
         
         if self.available_tools['idb'] or self.available_tools['devicectl']:
             from ..devices.real_device import RealDeviceManager
@@ -82,16 +116,69 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
                 # Silent failure during discovery
                 pass
         
-        # Update cache
+        self._store_device_cache(all_devices, current_time)
+        return all_devices
+    
+    async def discover_all_devices_async(self, refresh_cache: bool = False) -> List[DeviceInfo]:
+        """Discover all devices, awaiting simctl directly instead of holding a worker thread."""
+        current_time = time.time()
+        
+        # Use cache if valid
+        if (not refresh_cache and 
+            self._device_cache and 
+            current_time - self._last_cache_time < self._cache_timeout):
+            return self._device_cache.get('all_devices', [])
+        
+        all_devices = []
+        
+        # Discover simulators
+        if self.simulator_manager:
+            try:
+                simulators = await self.simulator_manager.list_simulators_async()
+                all_devices.extend(sim.to_device_info() for sim in simulators)
+            except Exception:
+                # Silent failure during discovery
+                pass
+        
+        # Discover real devices (still blocking tools, so keep them off the loop)
+        if self.real_device_manager:
+            try:
+                real_devices = await asyncio.to_thread(self.real_device_manager.list_devices)
+                all_devices.extend(device.to_device_info() for device in real_devices)
+            except Exception:
+                # Silent failure during discovery
+                pass
+        
+        self._store_device_cache(all_devices, current_time)
+        return all_devices
+    
+    def _store_device_cache(self, all_devices: List[DeviceInfo], current_time: float) -> None:
+        """Replace the cached device list."""
         self._device_cache = {'all_devices': all_devices}
+        self._devices_by_udid = {d.udid: d for d in all_devices}
         self._last_cache_time = current_time
+
+    def _update_cached_state(self, udid: str, state: DeviceState) -> None:
+        """Update a single cached device's state in place instead of dropping the cache."""
+        devices = self._device_cache.get('all_devices')
+        if not devices:
+            return
         
-        return all_devices
+        for i, device in enumerate(devices):
+            if device.udid == udid:
+                devices[i] = self._devices_by_udid[udid] = replace(device, state=state)
+                break
 
     def get_device(self, udid: str) -> Optional[DeviceInfo]:
         """Get device by UDID."""
-        devices = self.discover_all_devices()
-        return next((d for d in devices if d.udid == udid), None)
+        # Refreshes the cache when stale; the UDID index is rebuilt with it
+        self.discover_all_devices()
+        return self._devices_by_udid.get(udid)
+    
+    async def get_device_async(self, udid: str) -> Optional[DeviceInfo]:
+        """Get device by UDID, awaiting discovery instead of running it on the event loop."""
+        await self.discover_all_devices_async()
+        return self._devices_by_udid.get(udid)
     
     def get_device_by_name(self, name: str, device_type: Optional[DeviceType] = None) -> Optional[DeviceInfo]:
         """Get device by name with optional type filter."""
@@ -106,6 +193,12 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
     
     def boot_device(self, udid: str, timeout: int = 30) -> None:
         """Boot/connect to a device."""
+        # Concurrent callers for the same device wait for the first boot instead of repeating it
+        with self._boot_locks.setdefault(udid, threading.Lock()):
+            self._boot_device(udid, timeout)
+    
+    def _boot_device(self, udid: str, timeout: int) -> None:
+        """Boot/connect to a device (caller holds the device's boot lock)."""
         device = self.get_device(udid)
         if not device:
             raise DeviceNotFoundError(f"Device not found: {udid}")
@@ -113,11 +206,16 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
         if device.device_type == DeviceType.SIMULATOR:
             if not self.simulator_manager:
                 raise DeviceError("Simulator tools not available")
-            self.simulator_manager.boot_simulator(udid, timeout)
+            # The device cache may be stale (and maps 'Booting' to BOOTED), so only a
+            # fresh plist read of a fully booted simulator skips boot and bootstatus
+            if not self.simulator_manager.is_booted(udid):
+                self.simulator_manager.boot_simulator(udid, timeout)
+            self._update_cached_state(udid, DeviceState.BOOTED)
         else:
             if not self.real_device_manager:
                 raise DeviceError("Real device tools not available")
             self.real_device_manager.connect_device(udid, timeout)
+            self._update_cached_state(udid, DeviceState.CONNECTED)
     
     def shutdown_device(self, udid: str) -> None:
         """Shutdown/disconnect a device."""
@@ -126,9 +224,12 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
             raise DeviceNotFoundError(f"Device not found: {udid}")
         
         if device.device_type == DeviceType.SIMULATOR:
+            if device.state == DeviceState.SHUTDOWN:
+                return
             if not self.simulator_manager:
                 raise DeviceError("Simulator tools not available")
             self.simulator_manager.shutdown_simulator(udid)
+            self._update_cached_state(udid, DeviceState.SHUTDOWN)
         else:
             # Real devices typically can't be shutdown programmatically
             print(f"Note: Cannot shutdown real device {device.name}")
@@ -139,7 +240,7 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
         if not device:
             return False
         
-        return device.state in [DeviceState.BOOTED, DeviceState.CONNECTED]
+        return device.state in AVAILABLE_STATES
     
     def get_device_info(self, udid: str) -> Optional[DeviceInfo]:
         """Get device information."""
@@ -148,7 +249,7 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
     def get_available_devices(self, device_type: Optional[DeviceType] = None) -> List[DeviceInfo]:
         """Get available (connected/booted) devices."""
         devices = self.discover_all_devices()
-        available = [d for d in devices if d.state in [DeviceState.BOOTED, DeviceState.CONNECTED]]
+        available = [d for d in devices if d.state in AVAILABLE_STATES]
         
         if device_type:
             available = [d for d in available if d.device_type == device_type]
@@ -157,48 +258,62 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
     
     def wait_for_device(self, udid: str, timeout: int = 30) -> bool:
         """Wait for a device to become available."""
-        start_time = time.time()
+        device = self.get_device(udid)
+        if device and device.device_type == DeviceType.SIMULATOR and self.simulator_manager:
+            if device.state == DeviceState.BOOTED:
+                return True
+            # simctl blocks until the boot completes: one process instead of a poll loop
+            try:
+                self.simulator_manager.wait_for_boot(udid, timeout, boot=False)
+            except (DeviceError, subprocess.CalledProcessError):
+                return False
+            self._update_cached_state(udid, DeviceState.BOOTED)
+            return True
         
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        delay = 0.25
+        
+        while time.monotonic() < deadline:
             if self.is_device_available(udid):
                 return True
-            time.sleep(1)
+            # Back off so quick transitions return fast without hammering discovery
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, 2.0)
             self.discover_all_devices(refresh_cache=True)  # Refresh cache
         
         return False
     
+    async def wait_for_device_async(self, udid: str, timeout: int = 30) -> bool:
+        """Wait for a device to become available without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.25
+        
+        # Discovery is awaited (never the sync get_device path, which would run
+        # simctl/idb listings on the event loop when the cache is stale)
+        await self.discover_all_devices_async()
+        
+        while True:
+            device = self._devices_by_udid.get(udid)
+            if device is not None and device.state in AVAILABLE_STATES:
+                return True
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            delay = min(delay * 2, 2.0)
+            await self.discover_all_devices_async(refresh_cache=True)  # Refresh cache
+    
     def get_device_capabilities(self, udid: str) -> Dict[str, bool]:
         """Get device capabilities."""
         device = self.get_device(udid)
         if not device:
             return {}
         
+        # Capabilities depend only on the device type; no probing required
         if device.device_type == DeviceType.SIMULATOR:
-            return {
-                'can_install_apps': True,
-                'can_simulate_location': True,
-                'can_add_media': True,
-                'can_clear_keychain': True,
-                'can_erase_device': True,
-                'can_change_settings': True,
-                'requires_developer_profile': False,
-                'supports_debugging': True,
-                'supports_ui_automation': True,
-                'supports_performance_monitoring': True
-            }
+            return dict(SIMULATOR_CAPABILITIES)
         else:  # Real device
-            return {
-                'can_install_apps': True,  # With developer profile
-                'can_simulate_location': True,
-                'can_add_media': True,
-                'can_clear_keychain': False,
-                'can_erase_device': False,
-                'can_change_settings': False,
-                'requires_developer_profile': True,
-                'supports_debugging': True,
-                'supports_ui_automation': True,
-                'supports_performance_monitoring': True
-            }
+            return dict(REAL_DEVICE_CAPABILITIES)
     
     def erase_device(self, udid: str) -> None:
         """Erase device (simulators only)."""
@@ -213,6 +328,7 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
             raise DeviceError("Simulator tools not available")
         
         self.simulator_manager.erase_simulator(udid)
+        self._update_cached_state(udid, DeviceState.SHUTDOWN)
     
     def print_device_list(self, show_capabilities: bool = False):
         """Print formatted device list."""
@@ -264,7 +380,7 @@ class UnifiedDeviceManager(CommandExecutor, DeviceControllerInterface):
             'total_devices': len(devices),
             'simulators': len([d for d in devices if d.device_type == DeviceType.SIMULATOR]),
             'real_devices': len([d for d in devices if d.device_type == DeviceType.REAL_DEVICE]),
-            'available_devices': len([d for d in devices if d.state in [DeviceState.BOOTED, DeviceState.CONNECTED]]),
+            'available_devices': len([d for d in devices if d.state in AVAILABLE_STATES]),
             'tools_available': self.available_tools,
             'cache_age': time.time() - self._last_cache_time if self._last_cache_time else None
         }
\ No newline at end of file
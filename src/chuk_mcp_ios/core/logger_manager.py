@@ -27,6 +27,14 @@ from .base import (
 from .device_manager import UnifiedDeviceManager
 from .session_manager import UnifiedSessionManager
 
+# Log line formats, compiled once instead of per parsed line
+LOG_LINE_PATTERNS = (
+    # Standard format
+    re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+) (\w+)\s+(\w+)\[(\d+)\]: (.+)'),
+    # Alternative format
+    re.compile(r'(\w+ \d+ \d{2}:\d{2}:\d{2}) .+ (\w+)\[(\d+)\] <(\w+)>: (.+)'),
+)
+
 @dataclass
 class LogEntry:
     """Represents a single log entry."""
@@ -481,20 +489,18 @@ class UnifiedLoggerManager(CommandExecutor):
         if not self.device_manager.is_device_available(udid):
             raise DeviceNotAvailableError(f"Device not available: {udid}")
     
+    def _parse_log_output(self, output: str) -> List[LogEntry]:
+        """Parse command output into log entries, skipping blank lines."""
+        parse = self._parse_log_line
+        return [entry for entry in map(parse, filter(str.strip, output.splitlines())) if entry]
+    
     def _parse_log_line(self, line: str) -> Optional[LogEntry]:
         """Parse a log line into LogEntry."""
         # Common log format: timestamp level process[pid]: message
         # This is simplified - real implementation would handle various formats
         
-        patterns = [
-            # Standard format
-            r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+) (\w+)\s+(\w+)\[(\d+)\]: (.+)',
-            # Alternative format
-            r'(\w+ \d+ \d{2}:\d{2}:\d{2}) .+ (\w+)\[(\d+)\] <(\w+)>: (.+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, line)
+        for pattern in LOG_LINE_PATTERNS:
+            match = pattern.match(line)
             if match:
                 groups = match.groups()
                 try:
@@ -585,11 +591,7 @@ class UnifiedLoggerManager(CommandExecutor):
                 
                 result = self.run_command(command, timeout=10)
                 
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        entry = self._parse_log_line(line)
-                        if entry:
-                            entries.append(entry)
+                entries.extend(self._parse_log_output(result.stdout))
                 
             except Exception as e:
                 print(f"Warning: Failed to get logs via idb: {e}")
@@ -604,11 +606,7 @@ class UnifiedLoggerManager(CommandExecutor):
                 
                 result = self.run_command(command, timeout=10)
                 
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        entry = self._parse_log_line(line)
-                        if entry:
-                            entries.append(entry)
+                entries.extend(self._parse_log_output(result.stdout))
                             
             except Exception as e:
                 print(f"Warning: Failed to get logs via log show: {e}")
@@ -653,11 +651,7 @@ class UnifiedLoggerManager(CommandExecutor):
             
             result = self.run_command(command, timeout=10)
             
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    entry = self._parse_log_line(line)
-                    if entry:
-                        entries.append(entry)
+            entries.extend(self._parse_log_output(result.stdout))
                         
         except Exception as e:
             raise DeviceError(f"Failed to get logs: {e}")
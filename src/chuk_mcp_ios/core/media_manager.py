@@ -458,24 +458,25 @@ class UnifiedMediaManager(CommandExecutor, MediaManagerInterface):
         media_files = []
         
         for path in media_paths:
-            if not os.path.exists(path):
-                print(f"⚠️  File not found: {path}")
-                continue
-            
-            # Get file info
+            # Check the extension first; it needs no filesystem access
             ext = os.path.splitext(path)[1].lower()
             if ext not in self.supported_formats:
                 print(f"⚠️  Unsupported format: {path}")
                 continue
             
+            # Existence check and metadata in a single stat call
+            try:
+                stat = os.stat(path)
+            except OSError:
+                print(f"⚠️  File not found: {path}")
+                continue
+            
             # Determine media type
             if ext in self.supported_photo_formats:
                 media_type = 'photo'
             else:
                 media_type = 'video'
             
-            # Get file metadata
-            stat = os.stat(path)
             media_file = MediaFile(
                 path=path,
                 type=media_type,
@@ -9,17 +9,24 @@ Provides session lifecycle management, tracking, and cleanup.
 FIXED VERSION: Implements automatic cleanup, session limits, and better lifecycle management.
 """
 
+import re
 import time
+import heapq
+import logging
+import asyncio
 import secrets
+import threading
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import defaultdict
+from concurrent.futures import Executor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from .base import (
     DeviceType,
-    DeviceState,
+    AVAILABLE_STATES,
     DeviceInfo,
     SessionInfo,
     SessionError,
@@ -28,6 +35,26 @@ from .base import (
 )
 from .device_manager import UnifiedDeviceManager
 
+# orjson is optional ("fast-json" extra); the stdlib encoder is pure Python once indent is set
+try:
+    import orjson
+    
+    def dumps_indented(obj: Any, default=None) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def dumps_indented(obj: Any, default=None) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return json.dumps(obj, indent=2, default=default).encode('utf-8')
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between forced device rediscoveries in refresh_session
+REFRESH_MIN_INTERVAL = 2.0
+
+# Optional platform name followed by dotted numeric components, e.g. "iOS 16.4"
+OS_VERSION_PATTERN = re.compile(r'\s*([A-Za-z]*)\s*([\d.]*)')
+
 def generate_uuid4() -> str:
     """Generate a UUID4 string using secrets module to avoid uuid import issues."""
     # Generate 16 random bytes
@@ -46,7 +73,27 @@ def generate_uuid4() -> str:
     hex_string = f"{random_bytes:032x}"
     return f"{hex_string[:8]}-{hex_string[8:12]}-{hex_string[12:16]}-{hex_string[16:20]}-{hex_string[20:]}"
 
-@dataclass
+def parse_os_version(version: str) -> Tuple[str, Tuple[int, ...]]:
+    """Split an OS version such as "iOS 16.4" into ("ios", (16, 4))."""
+    match = OS_VERSION_PATTERN.match(version)
+    platform = match.group(1).lower()
+    numbers = tuple(int(n) for n in match.group(2).split('.') if n)
+    return platform, numbers
+
+def os_version_matches(wanted: Tuple[str, Tuple[int, ...]], os_version: str) -> bool:
+    """
+    Check a device OS version against a parsed requested version.
+    
+    Components are compared as a prefix, so "16" matches "iOS 16.4" but not
+    "iOS 6.1" or "iOS 161.0"; a platform name is only checked when one was given.
+    """
+    want_platform, want_numbers = wanted
+    platform, numbers = parse_os_version(os_version)
+    if want_platform and want_platform != platform:
+        return False
+    return numbers[:len(want_numbers)] == want_numbers
+
+@dataclass(slots=True)
 class SessionConfig:
     """Configuration for creating a new session."""
     device_name: Optional[str] = None
@@ -66,7 +113,8 @@ class UnifiedSessionManager:
     Fixed version with automatic cleanup and session limits.
     """
     
-    def __init__(self, session_dir: Optional[Path] = None, max_sessions: int = 10, auto_cleanup_hours: int = 6):
+    def __init__(self, session_dir: Optional[Path] = None, max_sessions: int = 10, auto_cleanup_hours: int = 6,
+                 device_manager: Optional[UnifiedDeviceManager] = None):
         """
         Initialize with automatic cleanup and session limits.
         
@@ -74,9 +122,15 @@ class UnifiedSessionManager:
             session_dir: Directory for session files
             max_sessions: Maximum number of concurrent sessions (default: 10)
             auto_cleanup_hours: Auto cleanup sessions older than this (default: 6 hours)
+            device_manager: Shared device manager (and its device cache) to use
         """
-        self.device_manager = UnifiedDeviceManager()
+        self.device_manager = device_manager or UnifiedDeviceManager()
         self.sessions: Dict[str, SessionInfo] = {}
+        self._creation_heap: List[Tuple[datetime, str]] = []  # (created_at, session_id), oldest first
+        self._sessions_by_type: Dict[DeviceType, set] = defaultdict(set)
+        self._last_refresh = float('-inf')  # monotonic time of the last forced device refresh
+        # Guards sessions and its indexes; create_session_async runs creates on worker threads
+        self._sessions_lock = threading.RLock()
         self.session_dir = session_dir or Path.home() / ".ios-device-control" / "sessions"
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.max_sessions = max_sessions
@@ -124,15 +178,16 @@ class UnifiedSessionManager:
         # Find or prepare device
         device = self._find_or_prepare_device(config)
         
-        # Generate session ID
-        session_id = self._generate_session_id(config.session_name)
+        # Generate session ID from the same clock read as the creation time
+        created_at = datetime.now()
+        session_id = self._generate_session_id(config.session_name, created_at)
         
         # Create session info
         session_info = SessionInfo(
             session_id=session_id,
             device_udid=device.udid,
             device_type=device.device_type,
-            created_at=datetime.now(),
+            created_at=created_at,
             metadata={
                 'device_name': device.name,
                 'os_version': device.os_version,
@@ -143,16 +198,51 @@ class UnifiedSessionManager:
             }
         )
         
-        # Store session
-        self.sessions[session_id] = session_info
+        # Re-check the limit and store atomically; concurrent creates may have
+        # filled the remaining slots while this device was being prepared
+        with self._sessions_lock:
+            if len(self.sessions) >= self.max_sessions:
+                raise SessionError(
+                    f"Maximum sessions ({self.max_sessions}) reached. "
+                    "Please terminate existing sessions first."
+                )
+            self._add_session(session_info)
         self._save_session(session_info)
         
-        print(f"✅ Session created: {session_id}")
-        print(f"   Device: {device.name} ({device.device_type.value})")
-        print(f"   Active sessions: {len(self.sessions)}/{self.max_sessions}")
+        logger.info("✅ Session created: %s (device: %s, %s; active sessions: %d/%d)",
+                    session_id, device.name, device.device_type.value, len(self.sessions), self.max_sessions)
         
         return session_id
     
+    async def create_session_async(self, config: Optional[SessionConfig] = None,
+                                   executor: Optional[Executor] = None) -> str:
+        """
+        Create a new device session without blocking the event loop.
+        
+        Device discovery is awaited directly; booting or waiting for the device
+        runs on the given executor (the loop's default when None), so several
+        sessions can be prepared concurrently.
+        
+        Args:
+            config: Session configuration
+            executor: Executor for the blocking boot/wait work
+            
+        Returns:
+            str: Session ID
+        """
+        # Warm the shared device cache without tying up a thread on simctl list
+        await self.device_manager.discover_all_devices_async()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.create_session, config)
+    
+    async def wait_for_session_async(self, session_id: str, timeout: int = 30) -> bool:
+        """Wait for session's device to become available without blocking the event loop."""
+        try:
+            udid = self.get_device_udid(session_id)
+        except SessionError:
+            return False
+        return await self.device_manager.wait_for_device_async(udid, timeout)
+    
     def terminate_session(self, session_id: str) -> None:
         """
         Terminate a session with proper cleanup.
@@ -168,7 +258,7 @@ class UnifiedSessionManager:
             session_file = self.session_dir / f"{session_id}.json"
             if session_file.exists():
                 session_file.unlink()
-                print(f"✅ Cleaned up orphaned session file: {session_id}")
+                logger.info("✅ Cleaned up orphaned session file: %s", session_id)
             else:
                 raise SessionError(f"Session not found: {session_id}")
             return
@@ -182,17 +272,17 @@ class UnifiedSessionManager:
                 # Optionally shutdown simulator if it was auto-booted
                 config = session_info.metadata.get('config', {})
                 if config.get('autoboot', False):
-                    print(f"Shutting down auto-booted simulator...")
+                    logger.info("Shutting down auto-booted simulator...")
                     self.device_manager.shutdown_device(session_info.device_udid)
         except Exception as e:
-            print(f"Warning: Cleanup failed: {e}")
+            logger.warning("Cleanup failed: %s", e)
         
         # Remove session
-        del self.sessions[session_id]
+        self._remove_session(session_id)
         self._delete_session_file(session_id)
         
-        print(f"✅ Session terminated: {session_id}")
-        print(f"   Active sessions: {len(self.sessions)}/{self.max_sessions}")
+        logger.info("✅ Session terminated: %s (active sessions: %d/%d)",
+                    session_id, len(self.sessions), self.max_sessions)
     
     def get_session_info(self, session_id: str) -> Dict[str, Any]:
         """
@@ -211,10 +301,41 @@ class UnifiedSessionManager:
             raise SessionError(f"Session not found: {session_id}")
         
         session_info = self.sessions[session_id]
+        device = self.device_manager.get_device(session_info.device_udid)
+        return self._build_session_info(session_id, session_info, device)
+    
+    def get_sessions_info(self, session_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get session information for several sessions from a single device listing.
+        
+        Args:
+            session_ids: Session IDs to describe (default: all sessions)
+            
+        Returns:
+            Dict mapping session ID to session details (unknown IDs are skipped)
+        """
+        with self._sessions_lock:
+            sessions = dict(self.sessions)
+        if session_ids is None:
+            session_ids = list(sessions.keys())
+        
+        devices = {d.udid: d for d in self.device_manager.discover_all_devices()}
+        
+        infos = {}
+        for session_id in session_ids:
+            session_info = sessions.get(session_id)
+            if session_info:
+                device = devices.get(session_info.device_udid)
+                infos[session_id] = self._build_session_info(session_id, session_info, device)
         
+        return infos
+    
+    def _build_session_info(self, session_id: str, session_info: SessionInfo,
+                            device: Optional[DeviceInfo]) -> Dict[str, Any]:
+        """Build the session details dict from an already resolved device."""
         # Get current device state
-        device = self.device_manager.get_device(session_info.device_udid)
         current_state = device.state.value if device else "unknown"
+        is_available = bool(device) and device.state in AVAILABLE_STATES
         
         # Calculate session age
         age = datetime.now() - session_info.created_at
@@ -228,7 +349,7 @@ class UnifiedSessionManager:
             'created_at': session_info.created_at.isoformat(),
             'age_seconds': age.total_seconds(),
             'current_state': current_state,
-            'is_available': self.is_session_available(session_id),
+            'is_available': is_available,
             'metadata': session_info.metadata,
             'capabilities': self.device_manager.get_device_capabilities(session_info.device_udid)
         }
@@ -342,22 +463,37 @@ class UnifiedSessionManager:
         Returns:
             List[str]: Cleaned up session IDs
         """
-        current_time = datetime.now()
-        max_age_seconds = max_age_hours * 3600
+        cutoff = datetime.now() - timedelta(hours=max_age_hours)
         cleaned = []
+        failed = []
         
-        for session_id, session_info in list(self.sessions.items()):
-            age = (current_time - session_info.created_at).total_seconds()
+        # Pop only expired entries from the creation-ordered heap
+        expired = []
+        with self._sessions_lock:
+            while self._creation_heap and self._creation_heap[0][0] < cutoff:
+                expired.append(heapq.heappop(self._creation_heap))
+        
+        for entry in expired:
+            session_id = entry[1]
             
-            if age > max_age_seconds:
-                try:
-                    self.terminate_session(session_id)
-                    cleaned.append(session_id)
-                except Exception as e:
-                    print(f"Failed to cleanup session {session_id}: {e}")
+            # Skip entries for sessions terminated elsewhere
+            if session_id not in self.sessions:
+                continue
+            
+            try:
+                self.terminate_session(session_id)
+                cleaned.append(session_id)
+            except Exception as e:
+                logger.warning("Failed to cleanup session %s: %s", session_id, e)
+                failed.append(entry)
+        
+        # Keep failed sessions eligible for the next cleanup
+        with self._sessions_lock:
+            for entry in failed:
+                heapq.heappush(self._creation_heap, entry)
         
         if cleaned:
-            print(f"Cleaned up {len(cleaned)} inactive sessions")
+            logger.info("Cleaned up %d inactive sessions", len(cleaned))
         
         return cleaned
     
@@ -374,28 +510,28 @@ class UnifiedSessionManager:
             
         cleaned = self.cleanup_inactive_sessions(max_age_hours)
         if cleaned:
-            print(f"🧹 Periodic cleanup: removed {len(cleaned)} inactive sessions")
+            logger.info("🧹 Periodic cleanup: removed %d inactive sessions", len(cleaned))
     
     def get_sessions_by_device_type(self, device_type: DeviceType) -> List[str]:
         """Get all sessions for a specific device type."""
-        return [
-            session_id for session_id, info in self.sessions.items()
-            if info.device_type == device_type
-        ]
+        with self._sessions_lock:
+            return list(self._sessions_by_type.get(device_type, ()))
     
     def get_sessions_by_device(self, device_udid: str) -> List[str]:
         """Get all sessions for a specific device."""
-        return [
-            session_id for session_id, info in self.sessions.items()
-            if info.device_udid == device_udid
-        ]
+        with self._sessions_lock:
+            return [
+                session_id for session_id, info in self.sessions.items()
+                if info.device_udid == device_udid
+            ]
     
-    def refresh_session(self, session_id: str) -> bool:
+    def refresh_session(self, session_id: str, force: bool = False) -> bool:
         """
         Refresh session by checking device availability.
         
         Args:
             session_id: Session ID
+            force: Rediscover devices even if a refresh ran within REFRESH_MIN_INTERVAL
             
         Returns:
             bool: True if session is still valid
@@ -403,8 +539,11 @@ class UnifiedSessionManager:
         if session_id not in self.sessions:
             return False
         
-        # Force device cache refresh
-        self.device_manager.discover_all_devices(refresh_cache=True)
+        # Force device cache refresh, at most once per interval for polling callers
+        now = time.monotonic()
+        if force or now - self._last_refresh >= REFRESH_MIN_INTERVAL:
+            self.device_manager.discover_all_devices(refresh_cache=True)
+            self._last_refresh = now
         
         return self.is_session_available(session_id)
     
@@ -412,38 +551,45 @@ class UnifiedSessionManager:
         """Print formatted status of all sessions."""
         sessions = self.list_sessions()
         
-        print(f"\n📊 Active Sessions ({len(sessions)}/{self.max_sessions}):")
-        print("=" * 60)
+        lines = [f"\n📊 Active Sessions ({len(sessions)}/{self.max_sessions}):", "=" * 60]
         
         if not sessions:
-            print("No active sessions")
+            lines.append("No active sessions")
+            print("\n".join(lines))
             return
         
+        # One device listing serves every session
+        infos = self.get_sessions_info(sessions)
+        
         for session_id in sessions:
             try:
-                info = self.get_session_info(session_id)
+                info = infos[session_id]
                 
                 # Format status
                 device_icon = "📱" if info['device_type'] == 'real_device' else "🖥️"
                 state_icon = "🟢" if info['is_available'] else "🔴"
                 
-                print(f"\n{device_icon} {session_id}")
-                print(f"   {state_icon} {info['device_name']} ({info['device_type']})")
-                print(f"   UDID: {info['device_udid']}")
-                print(f"   OS: {info['os_version']}")
-                print(f"   State: {info['current_state']}")
-                print(f"   Created: {info['created_at']}")
-                
                 # Show age
                 age_seconds = info['age_seconds']
                 if age_seconds < 3600:
                     age_str = f"{int(age_seconds / 60)} minutes"
                 else:
                     age_str = f"{int(age_seconds / 3600)} hours"
-                print(f"   Age: {age_str}")
+                
+                lines.extend([
+                    f"\n{device_icon} {session_id}",
+                    f"   {state_icon} {info['device_name']} ({info['device_type']})",
+                    f"   UDID: {info['device_udid']}",
+                    f"   OS: {info['os_version']}",
+                    f"   State: {info['current_state']}",
+                    f"   Created: {info['created_at']}",
+                    f"   Age: {age_str}"
+                ])
                 
             except Exception as e:
-                print(f"\n❌ {session_id} (Error: {e})")
+                lines.append(f"\n❌ {session_id} (Error: {e})")
+        
+        print("\n".join(lines))
     
     def _cleanup_old_sessions_on_startup(self):
         """Clean up old sessions on startup."""
@@ -490,7 +636,7 @@ class UnifiedSessionManager:
                     print(f"Failed to terminate old session {session_id}: {e}")
                     # Force remove
                     if session_id in self.sessions:
-                        del self.sessions[session_id]
+                        self._remove_session(session_id)
                     self._delete_session_file(session_id)
             
             print(f"✅ Enforced session limit: {len(self.sessions)}/{self.max_sessions}")
@@ -499,17 +645,22 @@ class UnifiedSessionManager:
         """Find or prepare a device based on configuration."""
         # Try to find specific device by UDID
         if config.device_udid:
+            # Direct lookup from the device cache; only rediscover on a miss
+            # (e.g. a simulator created since the cache was filled)
             device = self.device_manager.get_device(config.device_udid)
+            if not device:
+                self.device_manager.discover_all_devices(refresh_cache=True)
+                device = self.device_manager.get_device(config.device_udid)
             if not device:
                 raise DeviceNotFoundError(f"Device not found: {config.device_udid}")
             
             # Prepare device if needed
-            if not self.device_manager.is_device_available(device.udid):
+            if device.state not in AVAILABLE_STATES:
                 if device.device_type == DeviceType.SIMULATOR and config.autoboot:
-                    print(f"Booting simulator: {device.name}")
+                    logger.info("Booting simulator: %s", device.name)
                     self.device_manager.boot_device(device.udid)
                 elif device.device_type == DeviceType.REAL_DEVICE and config.wait_for_connection:
-                    print(f"Waiting for device connection: {device.name}")
+                    logger.info("Waiting for device connection: %s", device.name)
                     if not self.device_manager.wait_for_device(device.udid, timeout=30):
                         raise DeviceNotAvailableError(f"Device not available: {device.name}")
                 else:
@@ -517,36 +668,42 @@ class UnifiedSessionManager:
             
             return device
         
-        # Find by criteria
-        all_devices = self.device_manager.discover_all_devices()
-        
-        # Filter by criteria
-        candidates = all_devices
-        
-        if config.device_name:
-            candidates = [d for d in candidates if d.name == config.device_name]
-        
-        if config.device_type:
-            candidates = [d for d in candidates if d.device_type == config.device_type]
-        
-        if config.platform_version:
-            candidates = [d for d in candidates if config.platform_version in d.os_version]
+        # Find by criteria in a single pass, remembering the first match
+        # and the first already booted/connected match
+        first_match = None
+        first_available = None
+        
+        want_name = config.device_name
+        want_type = config.device_type
+        want_version = parse_os_version(config.platform_version) if config.platform_version else None
+        
+        for d in self.device_manager.discover_all_devices():
+            if want_name and d.name != want_name:
+                continue
+            if want_type and d.device_type != want_type:
+                continue
+            if want_version and not os_version_matches(want_version, d.os_version):
+                continue
+            
+            if first_match is None:
+                first_match = d
+            if d.state in AVAILABLE_STATES:
+                first_available = d
+                break
         
-        if not candidates:
+        if first_match is None:
             raise DeviceNotFoundError("No devices match the specified criteria")
         
         # Prefer available devices
-        if config.prefer_available:
-            available = [d for d in candidates if d.state in [DeviceState.BOOTED, DeviceState.CONNECTED]]
-            if available:
-                return available[0]
+        if config.prefer_available and first_available:
+            return first_available
         
         # Use first candidate and prepare it
-        device = candidates[0]
+        device = first_match
         
-        if not self.device_manager.is_device_available(device.udid):
+        if device.state not in AVAILABLE_STATES:
             if device.device_type == DeviceType.SIMULATOR and config.autoboot:
-                print(f"Booting simulator: {device.name}")
+                logger.info("Booting simulator: %s", device.name)
                 self.device_manager.boot_device(device.udid)
             elif device.device_type == DeviceType.REAL_DEVICE:
                 raise DeviceNotAvailableError(f"Real device not connected: {device.name}")
@@ -555,9 +712,23 @@ class UnifiedSessionManager:
         
         return device
     
-    def _generate_session_id(self, custom_name: Optional[str] = None) -> str:
+    def _add_session(self, session_info: SessionInfo):
+        """Register a session and keep the lookup indexes in sync."""
+        with self._sessions_lock:
+            self.sessions[session_info.session_id] = session_info
+            heapq.heappush(self._creation_heap, (session_info.created_at, session_info.session_id))
+            self._sessions_by_type[session_info.device_type].add(session_info.session_id)
+    
+    def _remove_session(self, session_id: str):
+        """Unregister a session (stale heap entries are skipped lazily)."""
+        with self._sessions_lock:
+            session_info = self.sessions.pop(session_id)
+            self._sessions_by_type[session_info.device_type].discard(session_id)
+    
+    def _generate_session_id(self, custom_name: Optional[str] = None,
+                             created_at: Optional[datetime] = None) -> str:
         """Generate unique session ID using alternative UUID generation."""
-        timestamp = int(time.time())
+        timestamp = int(created_at.timestamp()) if created_at else int(time.time())
         # Use first 8 characters of our custom UUID
         unique_id = generate_uuid4()[:8]
         
@@ -585,7 +756,7 @@ class UnifiedSessionManager:
             # Only log in debug mode to reduce noise
             # print(f"💾 Session saved: {session_info.session_id}")
         except Exception as e:
-            print(f"❌ Failed to save session {session_info.session_id}: {e}")
+            logger.error("❌ Failed to save session %s: %s", session_info.session_id, e)
             # Don't raise - allow session creation to continue even if save fails
     
     def _serialize_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -674,7 +845,7 @@ class UnifiedSessionManager:
                     metadata=data.get('metadata', {})
                 )
                 
-                self.sessions[session_info.session_id] = session_info
+                self._add_session(session_info)
                 loaded_count += 1
                 
                 # Stop loading if we hit the max limit
@@ -722,18 +893,19 @@ class UnifiedSessionManager:
             'sessions': []
         }
         
+        # One device listing serves every session
+        infos = self.get_sessions_info()
+        
         for session_id in self.sessions:
             try:
-                info = self.get_session_info(session_id)
-                data['sessions'].append(info)
+                data['sessions'].append(infos[session_id])
             except Exception as e:
                 data['sessions'].append({
                     'session_id': session_id,
                     'error': str(e)
                 })
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        Path(output_file).write_bytes(dumps_indented(data, default=self._json_serializer))
         
         print(f"📄 Exported {len(self.sessions)} sessions to {output_file}")
     
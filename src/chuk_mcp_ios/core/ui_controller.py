@@ -8,6 +8,11 @@ Handles UI automation and interactions for both simulators and real devices.
 
 import os
 import time
+import signal
+import asyncio
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
 import json
 import base64
 from typing import List, Optional, Union, Tuple, Dict, Any
@@ -18,21 +23,62 @@ from datetime import datetime
 from .base import (
     UIControllerInterface,
     CommandExecutor,
+    DeviceInfo,
     DeviceType,
+    AVAILABLE_STATES,
     DeviceNotAvailableError,
     DeviceError,
-    detect_available_tools
+    detect_available_tools,
+    resolve_executable
 )
 from .device_manager import UnifiedDeviceManager
 from .session_manager import UnifiedSessionManager
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Hardware buttons accepted by press_button
+VALID_BUTTONS = frozenset({'home', 'lock', 'volume_up', 'volume_down', 'siri', 'delete'})
+
+# Upper bound on threads used by tap_many
+MAX_PARALLEL_GESTURES = 16
+
+# Key names to macOS virtual key codes for press_key_combination
+KEY_CODES = {
+    'cmd': 55, 'command': 55,
+    'shift': 56,
+    'alt': 58, 'option': 58,
+    'ctrl': 59, 'control': 59,
+    'space': 49,
+    'return': 36, 'enter': 36,
+    'escape': 53, 'esc': 53,
+    'tab': 48,
+    'delete': 51, 'backspace': 51,
+    'a': 0, 'c': 8, 'v': 9, 'x': 7, 'z': 6
+}
+
+# Swipe directions: start point in sixths of the screen (x, y) and unit vector (dx, dy)
+SWIPE_DIRECTIONS = {
+    'up': (3, 4, 0, -1),
+    'down': (3, 2, 0, 1),
+    'left': (4, 3, -1, 0),
+    'right': (2, 3, 1, 0),
+}
+
+# Simulator screen sizes in points, matched against the device name (first match wins)
+SIMULATOR_SCREEN_SIZES = (
+    ('iPad', 1024, 1366, 2.0),
+    ('Pro Max', 430, 932, 3.0),
+    ('Pro', 393, 852, 3.0),
+)
+DEFAULT_SCREEN_SIZE = (390, 844, 3.0)
+
+@dataclass(slots=True)
 class Point:
     """Represents a point on screen."""
     x: int
     y: int
 
-@dataclass
+@dataclass(slots=True)
 class Gesture:
     """Represents a gesture configuration."""
     duration: int = 100  # milliseconds
@@ -40,7 +86,7 @@ class Gesture:
     repeat: int = 1
     delay_between: int = 100  # milliseconds between repeats
 
-@dataclass
+@dataclass(slots=True)
 class ScreenInfo:
     """Screen information."""
     width: int
@@ -82,22 +128,78 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             DeviceNotAvailableError: If device is not available
         """
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
+        device = self._get_available_device(udid)
         
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        if gesture is None:
+            gesture = Gesture()
+        
+        command = self._tap_plan(device, udid, x, y, gesture)
+        if command is None:
+            return
+        
+        # Repeat without re-resolving the device
+        for i in range(gesture.repeat):
+            if i:
+                time.sleep(gesture.delay_between / 1000)
+            try:
+                self.run_command(command)
+            except Exception as e:
+                self._tap_failed(device, e)
+                return
+        
+        logger.debug("✅ Tapped at (%d, %d)", x, y)
+    
+    def tap_many(self, taps: List[Tuple[Union[str, Dict], int, int]],
+                 max_workers: Optional[int] = None) -> None:
+        """
+        Tap on several devices concurrently.
+        
+        Each tap is an independent idb subprocess, so running them on a thread
+        pool scales with the number of devices. Taps are not ordered relative
+        to each other; use tap() for sequences on a single device.
+        
+        Args:
+            taps: List of (target, x, y) tuples
+            max_workers: Pool size (defaults to one thread per tap, capped)
+        """
+        if not taps:
+            return
+        
+        workers = max_workers or min(len(taps), MAX_PARALLEL_GESTURES)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ios-tap") as pool:
+            futures = [pool.submit(self.tap, target, x, y) for target, x, y in taps]
+            for future in as_completed(futures):
+                future.result()
+    
+    async def tap_async(self, target: Union[str, Dict], x: int, y: int,
+                        gesture: Optional[Gesture] = None) -> None:
+        """
+        Tap at coordinates without blocking the event loop.
+        
+        Independent taps (e.g. on different devices) can be awaited together
+        with asyncio.gather so their idb invocations run concurrently.
+        """
+        # Session lookup is an in-memory dict; device discovery is awaited
+        udid = self._resolve_target(target)
+        device = await self._get_available_device_async(udid)
         
         if gesture is None:
             gesture = Gesture()
         
-        # Perform tap based on device type
-        if device.device_type == DeviceType.SIMULATOR:
-            self._tap_simulator(udid, x, y, gesture)
-        else:
-            self._tap_real_device(udid, x, y, gesture)
+        command = self._tap_plan(device, udid, x, y, gesture)
+        if command is None:
+            return
+        
+        for i in range(gesture.repeat):
+            if i:
+                await asyncio.sleep(gesture.delay_between / 1000)
+            try:
+                await self.run_command_async(command)
+            except Exception as e:
+                self._tap_failed(device, e)
+                return
         
-        print(f"✅ Tapped at ({x}, {y})")
+        logger.debug("✅ Tapped at (%d, %d)", x, y)
     
     def double_tap(self, target: Union[str, Dict], x: int, y: int) -> None:
         """Double tap at coordinates."""
@@ -117,7 +219,7 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         """
         gesture = Gesture(duration=int(duration * 1000))
         self.tap(target, x, y, gesture)
-        print(f"✅ Long pressed at ({x}, {y}) for {duration}s")
+        logger.debug("✅ Long pressed at (%d, %d) for %ss", x, y, duration)
     
     def swipe(self, target: Union[str, Dict], start_x: int, start_y: int, 
               end_x: int, end_y: int, duration: int = 100) -> None:
@@ -133,76 +235,60 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             duration: Swipe duration in milliseconds
         """
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             self._swipe_simulator(udid, start_x, start_y, end_x, end_y, duration)
         else:
             self._swipe_real_device(udid, start_x, start_y, end_x, end_y, duration)
         
-        print(f"✅ Swiped from ({start_x}, {start_y}) to ({end_x}, {end_y})")
+        logger.debug("✅ Swiped from (%d, %d) to (%d, %d)", start_x, start_y, end_x, end_y)
     
     # Convenience Swipe Methods
     
-    def swipe_up(self, target: Union[str, Dict], distance: Optional[int] = None, 
-                 duration: int = 300) -> None:
-        """Swipe up from center of screen."""
-        screen = self.get_screen_info(target)
-        center_x = screen.width // 2
+    def swipe_direction(self, target: Union[str, Dict], direction: str,
+                        distance: Optional[int] = None, duration: int = 300) -> None:
+        """
+        Swipe in a direction from the middle of the screen.
         
-        if distance is None:
-            distance = screen.height // 3
+        Args:
+            target: Device UDID or session ID
+            direction: up, down, left or right
+            distance: Swipe distance (defaults to a third of the screen along the axis)
+            duration: Swipe duration in milliseconds
+        """
+        try:
+            start_x6, start_y6, dx, dy = SWIPE_DIRECTIONS[direction]
+        except KeyError:
+            raise ValueError(f"Invalid direction: {direction}. Valid: {sorted(SWIPE_DIRECTIONS)}") from None
         
-        start_y = screen.height * 2 // 3
-        end_y = start_y - distance
+        screen = self.get_screen_info(target)
+        if distance is None:
+            distance = (screen.width if dx else screen.height) // 3
         
-        self.swipe(target, center_x, start_y, center_x, end_y, duration)
+        start_x = screen.width * start_x6 // 6
+        start_y = screen.height * start_y6 // 6
+        self.swipe(target, start_x, start_y, start_x + dx * distance, start_y + dy * distance, duration)
+    
+    def swipe_up(self, target: Union[str, Dict], distance: Optional[int] = None, 
+                 duration: int = 300) -> None:
+        """Swipe up from center of screen."""
+        self.swipe_direction(target, 'up', distance, duration)
     
     def swipe_down(self, target: Union[str, Dict], distance: Optional[int] = None, 
                    duration: int = 300) -> None:
         """Swipe down from center of screen."""
-        screen = self.get_screen_info(target)
-        center_x = screen.width // 2
-        
-        if distance is None:
-            distance = screen.height // 3
-        
-        start_y = screen.height // 3
-        end_y = start_y + distance
-        
-        self.swipe(target, center_x, start_y, center_x, end_y, duration)
+        self.swipe_direction(target, 'down', distance, duration)
     
     def swipe_left(self, target: Union[str, Dict], distance: Optional[int] = None, 
                    duration: int = 300) -> None:
         """Swipe left from center of screen."""
-        screen = self.get_screen_info(target)
-        center_y = screen.height // 2
-        
-        if distance is None:
-            distance = screen.width // 3
-        
-        start_x = screen.width * 2 // 3
-        end_x = start_x - distance
-        
-        self.swipe(target, start_x, center_y, end_x, center_y, duration)
+        self.swipe_direction(target, 'left', distance, duration)
     
     def swipe_right(self, target: Union[str, Dict], distance: Optional[int] = None, 
                     duration: int = 300) -> None:
         """Swipe right from center of screen."""
-        screen = self.get_screen_info(target)
-        center_y = screen.height // 2
-        
-        if distance is None:
-            distance = screen.width // 3
-        
-        start_x = screen.width // 3
-        end_x = start_x + distance
-        
-        self.swipe(target, start_x, center_y, end_x, center_y, duration)
+        self.swipe_direction(target, 'right', distance, duration)
     
     # Advanced Gestures
     
@@ -243,7 +329,7 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         ]
         
         self.multi_touch_gesture(target, points, duration)
-        print(f"✅ Pinch gesture at ({center.x}, {center.y}) with scale {scale}")
+        logger.debug("✅ Pinch gesture at (%d, %d) with scale %s", center.x, center.y, scale)
     
     def zoom(self, target: Union[str, Dict], center: Optional[Point] = None, 
              scale: float = 2.0, duration: int = 300) -> None:
@@ -285,7 +371,7 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             points.append((start_x, start_y, end_x, end_y))
         
         self.multi_touch_gesture(target, points, duration)
-        print(f"✅ Rotated {degrees}° at ({center.x}, {center.y})")
+        logger.debug("✅ Rotated %s° at (%d, %d)", degrees, center.x, center.y)
     
     def multi_touch_gesture(self, target: Union[str, Dict], 
                            points: List[Tuple[int, int, int, int]], 
@@ -298,21 +384,18 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             points: List of (start_x, start_y, end_x, end_y) for each finger
             duration: Gesture duration
         """
+        # Resolve and verify once for the whole gesture, not per finger
         udid = self._resolve_target(target)
-        device = self.device_manager.get_device(udid)
-        
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         # Multi-touch is complex and tool-specific
         if device.device_type == DeviceType.SIMULATOR:
             # Simulate with sequential swipes for now
-            for point in points:
-                self.swipe(target, point[0], point[1], point[2], point[3], duration)
-                time.sleep(0.05)
+            for start_x, start_y, end_x, end_y in points:
+                self._swipe_simulator(udid, start_x, start_y, end_x, end_y, duration)
         else:
             # Real devices need special handling
-            print("⚠️  Multi-touch on real devices requires advanced tools")
+            logger.warning("⚠️  Multi-touch on real devices requires advanced tools")
     
     # Text Input
     
@@ -325,24 +408,19 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             text: Text to input
         """
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             self._input_text_simulator(udid, text)
         else:
             self._input_text_real_device(udid, text)
         
-        print(f"✅ Input text: {text[:50]}{'...' if len(text) > 50 else ''}")
+        logger.debug("✅ Input text: %.50s%s", text, '...' if len(text) > 50 else '')
     
     def clear_text(self, target: Union[str, Dict], field_length: int = 50) -> None:
         """Clear text from focused field."""
         # Select all and delete
         self.press_key_combination(target, ['cmd', 'a'])
-        time.sleep(0.1)
         self.press_button(target, 'delete')
     
     # Hardware Buttons
@@ -357,23 +435,19 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             button: Button name (home, lock, volume_up, volume_down, etc.)
             duration: Optional press duration in milliseconds
         """
-        udid = self._resolve_target(target)
-        self._verify_device_available(udid)
+        # Validate before touching the device
+        if button not in VALID_BUTTONS:
+            raise ValueError(f"Invalid button: {button}. Valid: {sorted(VALID_BUTTONS)}")
         
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
-        
-        valid_buttons = ['home', 'lock', 'volume_up', 'volume_down', 'siri', 'delete']
-        if button not in valid_buttons:
-            raise ValueError(f"Invalid button: {button}. Valid: {valid_buttons}")
+        udid = self._resolve_target(target)
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             self._press_button_simulator(udid, button, duration)
         else:
             self._press_button_real_device(udid, button, duration)
         
-        print(f"✅ Pressed {button} button")
+        logger.debug("✅ Pressed %s button", button)
     
     def press_key_combination(self, target: Union[str, Dict], keys: List[str]) -> None:
         """
@@ -391,24 +465,15 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         
         # Key combinations are mainly for simulators
         if device.device_type == DeviceType.SIMULATOR:
-            # Map key names to codes
-            key_map = {
-                'cmd': 55, 'command': 55,
-                'shift': 56,
-                'alt': 58, 'option': 58,
-                'ctrl': 59, 'control': 59,
-                'space': 49,
-                'return': 36, 'enter': 36,
-                'escape': 53, 'esc': 53,
-                'tab': 48,
-                'delete': 51, 'backspace': 51,
-                'a': 0, 'c': 8, 'v': 9, 'x': 7, 'z': 6
-            }
+            # Reject key names with no known key code
+            unknown = [key for key in keys if key.lower() not in KEY_CODES]
+            if unknown:
+                raise ValueError(f"Unknown key(s): {', '.join(unknown)}")
             
             # Send key combination
-            print(f"✅ Pressed key combination: {'+'.join(keys)}")
+            logger.debug("✅ Pressed key combination: %s", '+'.join(keys))
         else:
-            print("⚠️  Key combinations not supported on real devices")
+            logger.warning("⚠️  Key combinations not supported on real devices")
     
     # Screen Capture
     
@@ -425,11 +490,7 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             bytes or str: Screenshot data or file path
         """
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if output_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -440,9 +501,38 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         else:
             result = self._screenshot_real_device(udid, output_path)
         
-        print(f"✅ Screenshot saved: {output_path}")
+        logger.debug("✅ Screenshot saved: %s", output_path)
         return result
     
+    def take_screenshot_bytes(self, target: Union[str, Dict]) -> bytes:
+        """
+        Take screenshot and return the PNG data without writing a file.
+        
+        Args:
+            target: Device UDID or session ID
+            
+        Returns:
+            bytes: PNG image data
+        """
+        udid = self._resolve_target(target)
+        device = self._get_available_device(udid)
+        
+        # '-' makes simctl/idb write the image to stdout
+        if device.device_type == DeviceType.SIMULATOR:
+            command = [*self.simctl_args, "io", udid, "screenshot", "-"]
+        elif self.available_tools.get('idb'):
+            command = [self.idb_path, "screenshot", "--udid", udid, "-"]
+        else:
+            raise DeviceError("idb required for real device screenshots")
+        
+        try:
+            result = self.run_command(command, text=False)
+        except Exception as e:
+            raise DeviceError(f"Failed to take screenshot: {e}") from e
+        
+        logger.debug("✅ Screenshot captured: %d bytes", len(result.stdout))
+        return result.stdout
+    
     def record_video(self, target: Union[str, Dict], output_path: str, 
                     duration: int = 10, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -458,18 +548,14 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             str: Path to recorded video
         """
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             self._record_video_simulator(udid, output_path, duration, options)
         else:
             self._record_video_real_device(udid, output_path, duration, options)
         
-        print(f"✅ Video recorded: {output_path}")
+        logger.debug("✅ Video recorded: %s", output_path)
         return output_path
     
     # Screen Information
@@ -496,7 +582,7 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         
         # Get screen info based on device
         if device.device_type == DeviceType.SIMULATOR:
-            info = self._get_screen_info_simulator(udid)
+            info = self._get_screen_info_simulator(device)
         else:
             info = self._get_screen_info_real_device(udid)
         
@@ -529,9 +615,9 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         
         if device.device_type == DeviceType.SIMULATOR:
             # Rotate simulator
-            print(f"✅ Set orientation: {orientation}")
+            logger.debug("✅ Set orientation: %s", orientation)
         else:
-            print("⚠️  Orientation change on real devices requires physical rotation")
+            logger.warning("⚠️  Orientation change on real devices requires physical rotation")
     
     # Helper Methods
     
@@ -542,7 +628,7 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             if self.session_manager and target.startswith(('session_', 'automation_')):
                 try:
                     return self.session_manager.get_device_udid(target)
-                except:
+                except Exception:
                     pass
             # Otherwise assume it's a UDID
             return target
@@ -554,52 +640,115 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
     
     def _verify_device_available(self, udid: str):
         """Verify device is available."""
-        if not self.device_manager.is_device_available(udid):
+        self._get_available_device(udid)
+    
+    def _get_available_device(self, udid: str) -> DeviceInfo:
+        """Look up a device once and verify it is booted/connected."""
+        return self._check_available(udid, self.device_manager.get_device(udid))
+    
+    async def _get_available_device_async(self, udid: str) -> DeviceInfo:
+        """Like _get_available_device, awaiting device discovery."""
+        return self._check_available(udid, await self.device_manager.get_device_async(udid))
+    
+    def _check_available(self, udid: str, device: Optional[DeviceInfo]) -> DeviceInfo:
+        """Verify a looked-up device exists and is booted/connected."""
+        if not device:
+            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        if device.state not in AVAILABLE_STATES:
             raise DeviceNotAvailableError(f"Device not available: {udid}")
+        return device
     
-    # Simulator-specific implementations
+    def _tap_command(self, udid: str, x: int, y: int, gesture: Gesture) -> List[str]:
+        """Build the idb tap command."""
+        command = [self.idb_path, "ui", "--udid", udid, "tap", str(x), str(y)]
+        if gesture.duration > 100:
+            command += ["--duration", str(gesture.duration)]
+        return command
     
-    def _tap_simulator(self, udid: str, x: int, y: int, gesture: Gesture):
-        """Tap on simulator."""
+    def _tap_plan(self, device: DeviceInfo, udid: str, x: int, y: int,
+                  gesture: Gesture) -> Optional[List[str]]:
+        """
+        Choose how to tap a device (shared by tap and tap_async).
+        
+        Returns the idb tap command, or None when a simulator only has the
+        simctl fallback. Real devices without idb raise DeviceError.
+        """
         if self.available_tools.get('idb'):
-            try:
-                command = f"{self.idb_path} ui --udid {udid} tap {x} {y}"
-                if gesture.duration > 100:
-                    command += f" --duration {gesture.duration}"
-                self.run_command(command)
-                return
-            except:
-                pass
+            return self._tap_command(udid, x, y, gesture)
+        if device.device_type == DeviceType.SIMULATOR:
+            logger.warning("⚠️  Using simctl fallback (limited tap functionality)")
+            return None
+        raise DeviceError("idb required for real device UI automation")
+    
+    def _tap_failed(self, device: DeviceInfo, error: Exception) -> None:
+        """Handle a failed idb tap: real devices raise, simulators fall back to simctl."""
+        if device.device_type != DeviceType.SIMULATOR:
+            raise DeviceError(f"Failed to tap: {error}") from error
+        logger.warning("⚠️  Using simctl fallback (limited tap functionality)")
+    
+    def _record_for_duration(self, command: List[str], duration: int):
+        """
+        Run a recorder for duration seconds, then stop it with SIGINT.
         
-        # Fallback to simctl (limited functionality)
-        print("⚠️  Using simctl fallback (limited tap functionality)")
+        Both simctl recordVideo and idb record-video finalize the file on
+        SIGINT, so no external timeout wrapper process is needed.
+        """
+        process = subprocess.Popen(
+            [resolve_executable(command[0]), *command[1:]],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False
+        )
+        try:
+            process.wait(timeout=duration)
+        except subprocess.TimeoutExpired:
+            # Expected: recording ran for the full duration
+            process.send_signal(signal.SIGINT)
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise DeviceError("Recorder did not stop after SIGINT")
+            return
+        finally:
+            stderr = process.stderr.read() if process.stderr else ''
+            if process.stderr:
+                process.stderr.close()
+        
+        # Recorder exited on its own before the duration elapsed
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr)
+    
+    # Simulator-specific implementations
     
     def _swipe_simulator(self, udid: str, start_x: int, start_y: int, 
                         end_x: int, end_y: int, duration: int):
         """Swipe on simulator."""
         if self.available_tools.get('idb'):
             try:
-                command = f"{self.idb_path} ui --udid {udid} swipe {start_x} {start_y} {end_x} {end_y} {duration}"
+                command = [self.idb_path, "ui", "--udid", udid, "swipe",
+                           str(start_x), str(start_y), str(end_x), str(end_y), str(duration)]
                 self.run_command(command)
                 return
-            except:
+            except Exception:
                 pass
         
-        print("⚠️  Swipe requires idb for simulators")
+        logger.warning("⚠️  Swipe requires idb for simulators")
     
     def _input_text_simulator(self, udid: str, text: str):
         """Input text on simulator."""
         if self.available_tools.get('idb'):
             try:
-                escaped_text = text.replace('"', '\\"').replace('\\', '\\\\')
-                command = f'{self.idb_path} ui --udid {udid} text "{escaped_text}"'
-                self.run_command(command)
+                # Passed as a single argv entry, so no shell escaping is needed
+                self.run_command([self.idb_path, "ui", "--udid", udid, "text", text])
                 return
-            except:
+            except Exception:
                 pass
         
         # Fallback: paste text
-        print("⚠️  Text input requires idb for simulators")
+        logger.warning("⚠️  Text input requires idb for simulators")
     
     def _press_button_simulator(self, udid: str, button: str, duration: Optional[int]):
         """Press button on simulator."""
@@ -613,83 +762,60 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
             }
             
             if button in button_map:
-                self.run_command(f"{self.simctl_path} ui {udid} {button_map[button]}")
+                self.run_command([*self.simctl_args, "ui", udid, button_map[button]])
             elif self.available_tools.get('idb'):
-                command = f"{self.idb_path} ui --udid {udid} button {button}"
+                command = [self.idb_path, "ui", "--udid", udid, "button", button]
                 if duration:
-                    command += f" --duration {duration}"
+                    command += ["--duration", str(duration)]
                 self.run_command(command)
         except Exception as e:
-            raise DeviceError(f"Failed to press button: {e}")
+            raise DeviceError(f"Failed to press button: {e}") from e
     
     def _screenshot_simulator(self, udid: str, output_path: str) -> str:
         """Take screenshot on simulator."""
         try:
-            self.run_command(f"{self.simctl_path} io {udid} screenshot '{output_path}'")
+            self.run_command([*self.simctl_args, "io", udid, "screenshot", output_path])
             return output_path
         except Exception as e:
-            raise DeviceError(f"Failed to take screenshot: {e}")
+            raise DeviceError(f"Failed to take screenshot: {e}") from e
     
     def _record_video_simulator(self, udid: str, output_path: str, 
                                duration: int, options: Optional[Dict]):
         """Record video on simulator."""
         try:
             # Start recording
-            command = f"{self.simctl_path} io {udid} recordVideo '{output_path}'"
+            command = [*self.simctl_args, "io", udid, "recordVideo", output_path]
             if options:
                 if options.get('codec'):
-                    command += f" --codec {options['codec']}"
+                    command += ["--codec", str(options['codec'])]
                 if options.get('quality'):
-                    command += f" --quality {options['quality']}"
+                    command += ["--quality", str(options['quality'])]
             
-            # Run with timeout
-            self.run_command(f"timeout {duration} {command}", timeout=duration + 5)
+            self._record_for_duration(command, duration)
         except Exception as e:
-            # Timeout is expected
-            if "timeout" not in str(e).lower():
-                raise DeviceError(f"Failed to record video: {e}")
+            raise DeviceError(f"Failed to record video: {e}") from e
     
-    def _get_screen_info_simulator(self, udid: str) -> ScreenInfo:
+    def _get_screen_info_simulator(self, device: DeviceInfo) -> ScreenInfo:
         """Get screen info for simulator."""
-        # Default sizes for common devices
         # In practice, query the device model and look up specs
-        device = self.device_manager.get_device(udid)
-        
-        # Simple mapping based on device name
-        if 'iPad' in device.name:
-            return ScreenInfo(width=1024, height=1366, scale=2.0, orientation='portrait')
-        elif 'Pro Max' in device.name:
-            return ScreenInfo(width=430, height=932, scale=3.0, orientation='portrait')
-        elif 'Pro' in device.name:
-            return ScreenInfo(width=393, height=852, scale=3.0, orientation='portrait')
-        else:
-            # Default iPhone size
-            return ScreenInfo(width=390, height=844, scale=3.0, orientation='portrait')
+        width, height, scale = next(
+            (size[1:] for size in SIMULATOR_SCREEN_SIZES if size[0] in device.name),
+            DEFAULT_SCREEN_SIZE
+        )
+        return ScreenInfo(width=width, height=height, scale=scale, orientation='portrait')
     
     # Real device-specific implementations
     
-    def _tap_real_device(self, udid: str, x: int, y: int, gesture: Gesture):
-        """Tap on real device."""
-        if self.available_tools.get('idb'):
-            try:
-                command = f"{self.idb_path} ui --udid {udid} tap {x} {y}"
-                if gesture.duration > 100:
-                    command += f" --duration {gesture.duration}"
-                self.run_command(command)
-            except Exception as e:
-                raise DeviceError(f"Failed to tap: {e}")
-        else:
-            raise DeviceError("idb required for real device UI automation")
-    
     def _swipe_real_device(self, udid: str, start_x: int, start_y: int,
                           end_x: int, end_y: int, duration: int):
         """Swipe on real device."""
         if self.available_tools.get('idb'):
             try:
-                command = f"{self.idb_path} ui --udid {udid} swipe {start_x} {start_y} {end_x} {end_y} {duration}"
+                command = [self.idb_path, "ui", "--udid", udid, "swipe",
+                           str(start_x), str(start_y), str(end_x), str(end_y), str(duration)]
                 self.run_command(command)
             except Exception as e:
-                raise DeviceError(f"Failed to swipe: {e}")
+                raise DeviceError(f"Failed to swipe: {e}") from e
         else:
             raise DeviceError("idb required for real device UI automation")
     
@@ -697,11 +823,10 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         """Input text on real device."""
         if self.available_tools.get('idb'):
             try:
-                escaped_text = text.replace('"', '\\"').replace('\\', '\\\\')
-                command = f'{self.idb_path} ui --udid {udid} text "{escaped_text}"'
-                self.run_command(command)
+                # Passed as a single argv entry, so no shell escaping is needed
+                self.run_command([self.idb_path, "ui", "--udid", udid, "text", text])
             except Exception as e:
-                raise DeviceError(f"Failed to input text: {e}")
+                raise DeviceError(f"Failed to input text: {e}") from e
         else:
             raise DeviceError("idb required for real device UI automation")
     
@@ -709,12 +834,12 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         """Press button on real device."""
         if self.available_tools.get('idb'):
             try:
-                command = f"{self.idb_path} ui --udid {udid} button {button}"
+                command = [self.idb_path, "ui", "--udid", udid, "button", button]
                 if duration:
-                    command += f" --duration {duration}"
+                    command += ["--duration", str(duration)]
                 self.run_command(command)
             except Exception as e:
-                raise DeviceError(f"Failed to press button: {e}")
+                raise DeviceError(f"Failed to press button: {e}") from e
         else:
             raise DeviceError("idb required for real device UI automation")
     
@@ -722,10 +847,10 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         """Take screenshot on real device."""
         if self.available_tools.get('idb'):
             try:
-                self.run_command(f"{self.idb_path} screenshot --udid {udid} '{output_path}'")
+                self.run_command([self.idb_path, "screenshot", "--udid", udid, output_path])
                 return output_path
             except Exception as e:
-                raise DeviceError(f"Failed to take screenshot: {e}")
+                raise DeviceError(f"Failed to take screenshot: {e}") from e
         else:
             raise DeviceError("idb required for real device screenshots")
     
@@ -734,12 +859,10 @@ class UnifiedUIController(CommandExecutor, UIControllerInterface):
         """Record video on real device."""
         if self.available_tools.get('idb'):
             try:
-                command = f"{self.idb_path} record-video --udid {udid} '{output_path}'"
-                # Run with timeout
-                self.run_command(f"timeout {duration} {command}", timeout=duration + 5)
+                command = [self.idb_path, "record-video", "--udid", udid, output_path]
+                self._record_for_duration(command, duration)
             except Exception as e:
-                if "timeout" not in str(e).lower():
-                    raise DeviceError(f"Failed to record video: {e}")
+                raise DeviceError(f"Failed to record video: {e}") from e
         else:
             raise DeviceError("idb required for real device video recording")
     
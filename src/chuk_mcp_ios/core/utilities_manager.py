@@ -11,11 +11,16 @@ ENHANCED VERSION: Improved session ID to Device UDID resolution.
 
 import os
 import re
+import atexit
+import asyncio
 import json
 import time
+import logging
 import sqlite3
+import ipaddress
 import plistlib
 import subprocess
+from contextlib import closing
 from typing import List, Optional, Union, Dict, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -24,7 +29,9 @@ import urllib.parse
 
 from .base import (
     CommandExecutor,
+    DeviceInfo,
     DeviceType,
+    AVAILABLE_STATES,
     DeviceNotAvailableError,
     DeviceError,
     SessionError,
@@ -32,6 +39,52 @@ from .base import (
 )
 from .device_manager import UnifiedDeviceManager
 
+# orjson is optional ("fast-json" extra); both parsers accept the raw stdout bytes
+try:
+    from orjson import loads as loads_json
+except ImportError:
+    loads_json = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Accepted URL forms, compiled once: HTTP/HTTPS, custom schemes, email, phone, SMS
+URL_PATTERN = re.compile(
+    r'^(?:https?://|[a-zA-Z][a-zA-Z0-9+.-]*://|mailto:|tel:|sms:)',
+    re.IGNORECASE
+)
+
+# Schemes whose host/port are validated component-wise
+WEB_URL_PREFIXES = ('http://', 'https://')
+
+# Single DNS label (checked per label, never against the whole URL)
+HOSTNAME_LABEL_PATTERN = re.compile(r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?')
+
+# App Store search endpoint (query string is built with urlencode)
+APP_STORE_SEARCH_URL = "itms-apps://search.itunes.apple.com/WebObjects/MZSearch.woa/wa/search"
+
+# Permission services/statuses accepted by set_permission (O(1) membership)
+VALID_PERMISSION_SERVICES = frozenset({
+    'photos', 'camera', 'microphone', 'location', 'contacts',
+    'calendar', 'reminders', 'notifications', 'health'
+})
+VALID_PERMISSION_STATUSES = frozenset({'grant', 'deny', 'unset'})
+
+# Sorted once for error messages
+VALID_PERMISSION_SERVICES_SORTED = tuple(sorted(VALID_PERMISSION_SERVICES))
+VALID_PERMISSION_STATUSES_SORTED = tuple(sorted(VALID_PERMISSION_STATUSES))
+
+# Services granted by grant_all_permissions (health needs explicit consent)
+GRANT_ALL_SERVICES = (
+    'photos', 'camera', 'microphone', 'location', 'contacts',
+    'calendar', 'reminders', 'notifications'
+)
+
+# How long `idb describe` output is reused for a real device (seconds)
+DESCRIBE_CACHE_TTL = 5.0
+
+# Minimum seconds before retrying a failed `idb connect` for a device
+IDB_CONNECT_RETRY_INTERVAL = 30.0
+
 @dataclass
 class Permission:
     """Represents a device permission."""
@@ -84,18 +137,15 @@ class UnifiedUtilitiesManager(CommandExecutor):
         self.session_manager = None  # Optional session manager
         self.available_tools = detect_available_tools()
         
-        # Add logging if available
-        try:
-            import logging
-            self.logger = logging.getLogger(__name__)
-        except:
-            # Fallback logger
-            class FakeLogger:
-                def debug(self, msg): pass
-                def info(self, msg): pass
-                def warning(self, msg): pass
-                def error(self, msg): pass
-            self.logger = FakeLogger()
+        # Per-UDID device info caches: static simulator plist fields, and
+        # (timestamp, describe output) for real devices
+        self._simulator_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._describe_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # UDIDs with a companion registered via `idb connect` (reused by later idb calls),
+        # and monotonic times of failed connects so they are retried only occasionally
+        self._idb_connected: set = set()
+        self._idb_connect_failures: Dict[str, float] = {}
         
         # Predefined network profiles
         self.network_profiles = {
@@ -133,8 +183,7 @@ class UnifiedUtilitiesManager(CommandExecutor):
     def set_session_manager(self, session_manager):
         """Set session manager for session-based operations."""
         self.session_manager = session_manager
-        self.logger.debug(f"Session manager set: {id(session_manager)}")
-        print(f"🔧 Utilities manager configured with session manager: {id(session_manager)}")
+        logger.debug("🔧 Utilities manager configured with session manager: %s", id(session_manager))
     
 
     def _get_device_udid_from_session(self, session_id: str) -> str:
@@ -150,47 +199,27 @@ class UnifiedUtilitiesManager(CommandExecutor):
         Raises:
             SessionError: If session cannot be resolved
         """
-        # Strategy 1: Try the configured session manager first
+        # Use the configured session manager directly; its answer is authoritative
         if self.session_manager:
-            try:
-                device_udid = self.session_manager.get_device_udid(session_id)
-                self.logger.debug(f"Session {session_id} resolved via configured manager to {device_udid}")
-                return device_udid
-            except Exception as e:
-                self.logger.debug(f"Configured session manager failed for {session_id}: {e}")
+            device_udid = self.session_manager.get_device_udid(session_id)
+            logger.debug("Session %s resolved via configured manager to %s", session_id, device_udid)
+            return device_udid
         
-        # Strategy 2: Try to get session manager from global registry
+        # Standalone use: discover sessions persisted on disk
         try:
-            from ..mcp.tools import get_session_manager_for_session
-            session_manager = get_session_manager_for_session(session_id)
-            if session_manager:
-                self.logger.debug(f"Retrieved session manager from global registry for {session_id}")
-                device_udid = session_manager.get_device_udid(session_id)
-                self.logger.debug(f"Session {session_id} resolved via global registry to {device_udid}")
-                
-                # Update our session manager reference for future calls
-                self.session_manager = session_manager
-                return device_udid
-        except ImportError:
-            self.logger.debug("Global registry not available")
-        except Exception as e:
-            self.logger.debug(f"Global registry lookup failed for {session_id}: {e}")
-        
-        # Strategy 3: Try creating a new session manager and see if it can find the session
-        try:
-            self.logger.debug(f"Attempting fallback session discovery for {session_id}")
+            logger.debug("Attempting fallback session discovery for %s", session_id)
             from .session_manager import UnifiedSessionManager
             fallback_manager = UnifiedSessionManager()
             
             if session_id in fallback_manager.sessions:
                 device_udid = fallback_manager.get_device_udid(session_id)
-                self.logger.debug(f"Session {session_id} found via fallback manager: {device_udid}")
+                logger.debug("Session %s found via fallback manager: %s", session_id, device_udid)
                 
                 # Update our session manager reference
                 self.session_manager = fallback_manager
                 return device_udid
         except Exception as e:
-            self.logger.debug(f"Fallback session discovery failed: {e}")
+            logger.debug("Fallback session discovery failed: %s", e)
         
         # All strategies failed
         raise SessionError(f"Session {session_id} not found in any session manager - session may have expired or been terminated")
@@ -221,25 +250,25 @@ class UnifiedUtilitiesManager(CommandExecutor):
             SessionError: If session resolution fails
         """
         if isinstance(target, str):
-            self.logger.debug(f"🔍 Resolving target: {target}")
+            logger.debug("🔍 Resolving target: %s", target)
             
             # Check if it looks like a session ID
             if self._looks_like_session_id(target):
-                self.logger.debug(f"🎯 Target appears to be session ID: {target}")
+                logger.debug("🎯 Target appears to be session ID: %s", target)
                 
                 try:
                     device_udid = self._get_device_udid_from_session(target)
-                    self.logger.debug(f"✅ Resolved session {target} to device {device_udid}")
+                    logger.debug("✅ Resolved session %s to device %s", target, device_udid)
                     return device_udid
                 except SessionError as e:
-                    self.logger.error(f"❌ Failed to resolve session {target}: {e}")
+                    logger.error("❌ Failed to resolve session %s: %s", target, e)
                     raise
                 except Exception as e:
-                    self.logger.error(f"❌ Unexpected error resolving session {target}: {e}")
+                    logger.error("❌ Unexpected error resolving session %s: %s", target, e)
                     raise SessionError(f"Failed to resolve session {target}: {e}")
             
             # Treat as direct device UDID
-            self.logger.debug(f"🎯 Treating {target} as direct device UDID")
+            logger.debug("🎯 Treating %s as direct device UDID", target)
             return target
             
         elif isinstance(target, dict):
@@ -266,22 +295,18 @@ class UnifiedUtilitiesManager(CommandExecutor):
         Raises:
             DeviceNotAvailableError: If device is not available
         """
-        self.logger.info(f"📱 Opening URL: {url}")
+        logger.info("📱 Opening URL: %s", url)
         
         # Enhanced target resolution
         udid = self._resolve_target(target)
-        self.logger.debug(f"🎯 Target resolved to device UDID: {udid}")
-        
-        # Verify device is available using the resolved UDID
-        self._verify_device_available(udid)
+        logger.debug("🎯 Target resolved to device UDID: %s", udid)
         
         # Validate URL
         if not self._is_valid_url(url):
             raise ValueError(f"Invalid URL: {url}")
         
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        # Verify device is available using the resolved UDID (single lookup)
+        device = self._get_available_device(udid)
         
         # Open URL based on device type
         if device.device_type == DeviceType.SIMULATOR:
@@ -289,8 +314,31 @@ class UnifiedUtilitiesManager(CommandExecutor):
         else:
             self._open_url_real_device(udid, url)
         
-        self.logger.info(f"✅ Successfully opened URL: {url}")
-        print(f"✅ Opened URL: {url}")
+        logger.info("✅ Opened URL: %s", url)
+    
+    async def open_url_async(self, target: Union[str, Dict], url: str) -> None:
+        """
+        Open URL without blocking the event loop.
+        
+        Independent opens (e.g. on different devices) can be awaited together
+        with asyncio.gather so their simctl/idb invocations run concurrently.
+        """
+        logger.info("📱 Opening URL: %s", url)
+        
+        if not self._is_valid_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+        
+        udid, device = await self._resolve_available_device_async(target)
+        command = self._open_url_command(device, udid, url)
+        if device.device_type != DeviceType.SIMULATOR:
+            await asyncio.to_thread(self._ensure_idb_companion, udid)
+        
+        try:
+            await self.run_command_async(command)
+        except Exception as e:
+            raise DeviceError(f"Failed to open URL: {e}") from e
+        
+        logger.info("✅ Opened URL: %s", url)
     
     def open_scheme(self, target: Union[str, Dict], scheme_name: str) -> None:
         """Open predefined URL scheme."""
@@ -302,7 +350,7 @@ class UnifiedUtilitiesManager(CommandExecutor):
         url = f"{scheme.scheme}://"
         
         self.open_url(target, url)
-        print(f"✅ Opened {scheme.description or scheme_name}")
+        logger.info("✅ Opened %s", scheme.description or scheme_name)
     
     def open_settings(self, target: Union[str, Dict], page: Optional[str] = None) -> None:
         """
@@ -344,11 +392,7 @@ class UnifiedUtilitiesManager(CommandExecutor):
             List[Permission]: App permissions
         """
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             return self._get_permissions_simulator(udid, bundle_id)
@@ -366,40 +410,157 @@ class UnifiedUtilitiesManager(CommandExecutor):
             service: Permission service (photos, camera, location, etc.)
             status: Permission status (grant, deny, unset)
         """
+        # Validate arguments before touching the device
+        if service not in VALID_PERMISSION_SERVICES:
+            raise ValueError(f"Invalid service: {service}. Valid: {VALID_PERMISSION_SERVICES_SORTED}")
+        if status not in VALID_PERMISSION_STATUSES:
+            raise ValueError(f"Invalid status: {status}. Valid: {VALID_PERMISSION_STATUSES_SORTED}")
+        
         # Enhanced target resolution
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        valid_services = ['photos', 'camera', 'microphone', 'location', 'contacts', 
-                         'calendar', 'reminders', 'notifications', 'health']
-        valid_statuses = ['grant', 'deny', 'unset']
-        
-        if service not in valid_services:
-            raise ValueError(f"Invalid service: {service}. Valid: {valid_services}")
-        if status not in valid_statuses:
-            raise ValueError(f"Invalid status: {status}. Valid: {valid_statuses}")
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             self._set_permission_simulator(udid, bundle_id, service, status)
         else:
             self._set_permission_real_device(udid, bundle_id, service, status)
         
-        print(f"✅ Set {service} permission to {status} for {bundle_id}")
+        logger.info("✅ Set %s permission to %s for %s", service, status, bundle_id)
     
-    def grant_all_permissions(self, target: Union[str, Dict], bundle_id: str) -> None:
-        """Grant all permissions to an app."""
-        services = ['photos', 'camera', 'microphone', 'location', 'contacts', 
-                   'calendar', 'reminders', 'notifications']
+    def set_permissions(self, target: Union[str, Dict], bundle_id: str,
+                        permissions: Dict[str, str]) -> List[str]:
+        """
+        Set several app permissions with one target resolution.
+        
+        Args:
+            target: Device UDID or session ID
+            bundle_id: App bundle identifier
+            permissions: Mapping of service to status (grant, deny, unset)
+            
+        Returns:
+            List[str]: Services that could not be set
+        """
+        # Validate the whole batch before touching the device
+        invalid_services = permissions.keys() - VALID_PERMISSION_SERVICES
+        if invalid_services:
+            raise ValueError(f"Invalid services: {sorted(invalid_services)}. Valid: {VALID_PERMISSION_SERVICES_SORTED}")
+        invalid_statuses = set(permissions.values()) - VALID_PERMISSION_STATUSES
+        if invalid_statuses:
+            raise ValueError(f"Invalid statuses: {sorted(invalid_statuses)}. Valid: {VALID_PERMISSION_STATUSES_SORTED}")
         
-        for service in services:
+        udid = self._resolve_target(target)
+        device = self._get_available_device(udid)
+        commands, failed = self._permission_commands(udid, device, bundle_id, permissions)
+        
+        for services, command in commands.items():
             try:
-                self.set_permission(target, bundle_id, service, 'grant')
+                self.run_command(command)
             except Exception as e:
-                print(f"⚠️  Failed to grant {service}: {e}")
+                logger.warning("⚠️  Failed to set %s: %s", ', '.join(services), e)
+                failed.extend(services)
+        
+        logger.info("✅ Set %d of %d permissions for %s",
+                    len(permissions) - len(failed), len(permissions), bundle_id)
+        return failed
+    
+    def grant_all_permissions(self, target: Union[str, Dict], bundle_id: str) -> List[str]:
+        """
+        Grant all permissions to an app.
+        
+        Returns:
+            List[str]: Services that could not be granted
+        """
+        try:
+            failed = self.set_permissions(target, bundle_id, dict.fromkeys(GRANT_ALL_SERVICES, 'grant'))
+        except Exception as e:
+            logger.warning("⚠️  Failed to grant permissions: %s", e)
+            return list(GRANT_ALL_SERVICES)
+        
+        self._log_permission_failures(bundle_id, failed)
+        return failed
+    
+    async def grant_all_permissions_async(self, target: Union[str, Dict], bundle_id: str) -> List[str]:
+        """
+        Grant all permissions to an app without blocking the event loop.
+        
+        Simulator grants are issued concurrently; real devices take every
+        service in a single idb approve call.
+        
+        Returns:
+            List[str]: Services that could not be granted
+        """
+        # Same contract as grant_all_permissions: resolution/availability
+        # failures are logged and reported as every service failing
+        try:
+            udid, device = await self._resolve_available_device_async(target)
+        except Exception as e:
+            logger.warning("⚠️  Failed to grant permissions: %s", e)
+            return list(GRANT_ALL_SERVICES)
+        
+        if device.device_type != DeviceType.SIMULATOR and self.available_tools.get('idb'):
+            # Connect off the loop; _permission_commands then finds it registered
+            await asyncio.to_thread(self._ensure_idb_companion, udid)
+        
+        permissions = dict.fromkeys(GRANT_ALL_SERVICES, 'grant')
+        commands, failed = self._permission_commands(udid, device, bundle_id, permissions)
+        
+        results = await asyncio.gather(
+            *(self.run_command_async(command, show_errors=False) for command in commands.values()),
+            return_exceptions=True
+        )
+        for services, result in zip(commands, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("⚠️  Failed to grant %s: %s", ', '.join(services), result)
+                failed.extend(services)
+        
+        self._log_permission_failures(bundle_id, failed)
+        return failed
+    
+    def _permission_commands(self, udid: str, device: DeviceInfo, bundle_id: str,
+                             permissions: Dict[str, str]) -> Tuple[Dict[Tuple[str, ...], List[str]], List[str]]:
+        """
+        Build the commands applying a {service: status} mapping.
+        
+        Returns:
+            The commands keyed by the services each covers, and the services
+            that cannot be set on this device at all
+        """
+        if device.device_type == DeviceType.SIMULATOR:
+            # simctl privacy takes one service per invocation
+            commands = {(service,): self._simulator_permission_command(udid, bundle_id, service, status)
+                        for service, status in permissions.items()}
+            return commands, []
+        
+        if not self.available_tools.get('idb'):
+            logger.warning("⚠️  Permission management requires idb for real devices")
+            return {}, list(permissions)
+        
+        # idb approve accepts every granted service in a single call
+        granted = tuple(service for service, status in permissions.items() if status == 'grant')
+        unsupported = [service for service, status in permissions.items() if status != 'grant']
+        if unsupported:
+            logger.warning("⚠️  Permission denial not supported on real devices")
+        if not granted:
+            return {}, unsupported
+        
+        self._ensure_idb_companion(udid)
+        return {granted: self._idb_approve_command(udid, bundle_id, granted)}, unsupported
+    
+    def _simulator_permission_command(self, udid: str, bundle_id: str,
+                                      service: str, status: str) -> List[str]:
+        """Build the simctl privacy command for one service."""
+        return [*self.simctl_args, "privacy", udid, status, service, bundle_id]
+    
+    def _idb_approve_command(self, udid: str, bundle_id: str, services: Tuple[str, ...]) -> List[str]:
+        """Build the idb approve command for one or more services."""
+        return [self.idb_path, "approve", "--udid", udid, bundle_id, *services]
+    
+    def _log_permission_failures(self, bundle_id: str, failed: List[str]):
+        """Report services that could not be granted (partial failure is not success)."""
+        if failed:
+            logger.warning("⚠️  Could not grant %s for %s", ', '.join(failed), bundle_id)
+        else:
+            logger.info("✅ Granted all permissions for %s", bundle_id)
     
     def reset_permissions(self, target: Union[str, Dict], 
                          bundle_id: Optional[str] = None) -> None:
@@ -410,15 +571,15 @@ class UnifiedUtilitiesManager(CommandExecutor):
         if device and device.device_type == DeviceType.SIMULATOR:
             try:
                 if bundle_id:
-                    self.run_command(f"{self.simctl_path} privacy {udid} reset all {bundle_id}")
-                    print(f"✅ Reset permissions for {bundle_id}")
+                    self.run_command([*self.simctl_args, "privacy", udid, "reset", "all", bundle_id])
+                    logger.info("✅ Reset permissions for %s", bundle_id)
                 else:
-                    self.run_command(f"{self.simctl_path} privacy {udid} reset all")
-                    print("✅ Reset all permissions")
+                    self.run_command([*self.simctl_args, "privacy", udid, "reset", "all"])
+                    logger.info("✅ Reset all permissions")
             except Exception as e:
                 raise DeviceError(f"Failed to reset permissions: {e}")
         else:
-            print("⚠️  Permission reset only supported on simulators")
+            logger.warning("⚠️  Permission reset only supported on simulators")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Keychain Operations
@@ -428,18 +589,14 @@ class UnifiedUtilitiesManager(CommandExecutor):
         """Clear device keychain."""
         # Enhanced target resolution
         udid = self._resolve_target(target)
-        self._verify_device_available(udid)
-        
-        device = self.device_manager.get_device(udid)
-        if not device:
-            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        device = self._get_available_device(udid)
         
         if device.device_type == DeviceType.SIMULATOR:
             self._clear_keychain_simulator(udid)
         else:
             self._clear_keychain_real_device(udid)
         
-        print("✅ Keychain cleared")
+        logger.info("✅ Keychain cleared")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Network Operations
@@ -468,16 +625,16 @@ class UnifiedUtilitiesManager(CommandExecutor):
         
         if device.device_type == DeviceType.SIMULATOR:
             # Note: Network conditioning for simulators requires additional setup
-            print(f"⚠️  Network conditioning on simulators requires Network Link Conditioner")
-            print(f"   Profile: {profile.name}")
-            print(f"   Bandwidth: ↓{profile.bandwidth_down} ↑{profile.bandwidth_up} kbps")
-            print(f"   Latency: {profile.latency}ms, Loss: {profile.packet_loss}%")
+            logger.warning("⚠️  Network conditioning on simulators requires Network Link Conditioner")
+            logger.info("   Profile: %s", profile.name)
+            logger.info("   Bandwidth: ↓%s ↑%s kbps", profile.bandwidth_down, profile.bandwidth_up)
+            logger.info("   Latency: %sms, Loss: %s%%", profile.latency, profile.packet_loss)
         else:
-            print("⚠️  Network conditioning on real devices requires device configuration")
+            logger.warning("⚠️  Network conditioning on real devices requires device configuration")
     
     def clear_network_condition(self, target: Union[str, Dict]) -> None:
         """Clear network conditioning."""
-        print("✅ Network conditioning cleared (requires manual configuration)")
+        logger.info("✅ Network conditioning cleared (requires manual configuration)")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Device Settings
@@ -534,9 +691,9 @@ class UnifiedUtilitiesManager(CommandExecutor):
             if settings.timezone:
                 self._set_simulator_timezone(udid, settings.timezone)
             
-            print("✅ Device settings updated (restart may be required)")
+            logger.info("✅ Device settings updated (restart may be required)")
         else:
-            print("⚠️  Device settings modification limited on real devices")
+            logger.warning("⚠️  Device settings modification limited on real devices")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Clipboard Operations
@@ -551,18 +708,17 @@ class UnifiedUtilitiesManager(CommandExecutor):
             raise DeviceNotAvailableError(f"Device not found: {udid}")
         
         if device.device_type == DeviceType.SIMULATOR:
-            # Use pbcopy through simulator
+            # Feed the text to the simulator pasteboard on stdin; no shell quoting involved
             try:
-                escaped_text = text.replace("'", "'\"'\"'")
-                self.run_command(f"echo '{escaped_text}' | pbcopy")
-                print(f"✅ Clipboard set: {text[:50]}{'...' if len(text) > 50 else ''}")
+                self.run_command([*self.simctl_args, "pbcopy", udid], input_data=text)
+                logger.info("✅ Clipboard set: %s%s", text[:50], '...' if len(text) > 50 else '')
             except Exception as e:
                 raise DeviceError(f"Failed to set clipboard: {e}")
         else:
-            print("⚠️  Clipboard operations not supported on real devices via this tool")
+            logger.warning("⚠️  Clipboard operations not supported on real devices via this tool")
     
     def get_clipboard(self, target: Union[str, Dict]) -> Optional[str]:
-        """Get clipboard content."""
+        """Get clipboard content (the simulator's pasteboard, not the host Mac's)."""
         udid = self._resolve_target(target)
         device = self.device_manager.get_device(udid)
         
@@ -571,12 +727,12 @@ class UnifiedUtilitiesManager(CommandExecutor):
         
         if device.device_type == DeviceType.SIMULATOR:
             try:
-                result = self.run_command("pbpaste")
+                result = self.run_command([*self.simctl_args, "pbpaste", udid])
                 return result.stdout.strip()
             except:
                 return None
         else:
-            print("⚠️  Clipboard operations not supported on real devices via this tool")
+            logger.warning("⚠️  Clipboard operations not supported on real devices via this tool")
             return None
     
     # ═══════════════════════════════════════════════════════════════════════════
@@ -590,8 +746,9 @@ class UnifiedUtilitiesManager(CommandExecutor):
     
     def search_app_store(self, target: Union[str, Dict], query: str) -> None:
         """Search App Store."""
-        encoded_query = urllib.parse.quote(query)
-        url = f"itms-apps://search.itunes.apple.com/WebObjects/MZSearch.woa/wa/search?media=software&term={encoded_query}"
+        params = urllib.parse.urlencode({'media': 'software', 'term': query},
+                                        quote_via=urllib.parse.quote)
+        url = f"{APP_STORE_SEARCH_URL}?{params}"
         self.open_url(target, url)
     
     # ═══════════════════════════════════════════════════════════════════════════
@@ -604,13 +761,13 @@ class UnifiedUtilitiesManager(CommandExecutor):
         device = self.device_manager.get_device(udid)
         
         if device and device.device_type == DeviceType.SIMULATOR:
-            print("✅ Developer mode enabled for simulator")
+            logger.info("✅ Developer mode enabled for simulator")
         else:
-            print("⚠️  Developer mode must be enabled manually on real devices:")
-            print("   1. Go to Settings > Privacy & Security")
-            print("   2. Tap Developer Mode")
-            print("   3. Toggle Developer Mode on")
-            print("   4. Restart device")
+            logger.warning("⚠️  Developer mode must be enabled manually on real devices:")
+            logger.info("   1. Go to Settings > Privacy & Security")
+            logger.info("   2. Tap Developer Mode")
+            logger.info("   3. Toggle Developer Mode on")
+            logger.info("   4. Restart device")
     
     def simulate_memory_warning(self, target: Union[str, Dict]) -> None:
         """Simulate memory warning."""
@@ -619,12 +776,12 @@ class UnifiedUtilitiesManager(CommandExecutor):
         
         if device and device.device_type == DeviceType.SIMULATOR:
             try:
-                self.run_command(f"{self.simctl_path} spawn {udid} memory_pressure -S critical")
-                print("✅ Memory warning simulated")
+                self.run_command([*self.simctl_args, "spawn", udid, "memory_pressure", "-S", "critical"])
+                logger.info("✅ Memory warning simulated")
             except Exception as e:
-                print(f"⚠️  Failed to simulate memory warning: {e}")
+                logger.warning("⚠️  Failed to simulate memory warning: %s", e)
         else:
-            print("⚠️  Memory warning simulation only available on simulators")
+            logger.warning("⚠️  Memory warning simulation only available on simulators")
     
     def trigger_icloud_sync(self, target: Union[str, Dict]) -> None:
         """Trigger iCloud sync."""
@@ -633,12 +790,12 @@ class UnifiedUtilitiesManager(CommandExecutor):
         
         if device and device.device_type == DeviceType.SIMULATOR:
             try:
-                self.run_command(f"{self.simctl_path} spawn {udid} notifyutil -p com.apple.icloud.sync")
-                print("✅ iCloud sync triggered")
+                self.run_command([*self.simctl_args, "spawn", udid, "notifyutil", "-p", "com.apple.icloud.sync"])
+                logger.info("✅ iCloud sync triggered")
             except:
-                print("⚠️  Could not trigger iCloud sync")
+                logger.warning("⚠️  Could not trigger iCloud sync")
         else:
-            print("⚠️  iCloud sync trigger only available on simulators")
+            logger.warning("⚠️  iCloud sync trigger only available on simulators")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Focus and Window Management
@@ -657,12 +814,12 @@ class UnifiedUtilitiesManager(CommandExecutor):
                     activate
                 end tell
                 '''
-                self.run_command(f"osascript -e '{script}'")
-                print("✅ Simulator window focused")
+                self.run_command(["osascript", "-e", script])
+                logger.info("✅ Simulator window focused")
             except Exception as e:
-                print(f"⚠️  Failed to focus simulator: {e}")
+                logger.warning("⚠️  Failed to focus simulator: %s", e)
         else:
-            print("⚠️  Window focus only available for simulators")
+            logger.warning("⚠️  Window focus only available for simulators")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Utility Methods
@@ -684,39 +841,82 @@ class UnifiedUtilitiesManager(CommandExecutor):
                 
                 # Create backup
                 shutil.make_archive(str(backup_path.with_suffix('')), 'zip', device_dir)
-                print(f"✅ Backup created: {backup_path}")
+                logger.info("✅ Backup created: %s", backup_path)
             else:
                 raise DeviceError("Simulator data directory not found")
         else:
-            print("⚠️  Backup only supported for simulators")
+            logger.warning("⚠️  Backup only supported for simulators")
     
     def restore_backup(self, target: Union[str, Dict], backup_path: Path) -> None:
         """Restore device backup (simulators only)."""
-        print("⚠️  Backup restore not implemented - requires careful handling")
+        logger.warning("⚠️  Backup restore not implemented - requires careful handling")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Helper Methods
     # ═══════════════════════════════════════════════════════════════════════════
     
-    def _verify_device_available(self, udid: str):
-        """Verify device is available."""
-        self.logger.debug(f"Verifying device availability: {udid}")
-        if not self.device_manager.is_device_available(udid):
+    def _get_available_device(self, udid: str) -> DeviceInfo:
+        """Look up a device once and verify it is booted/connected."""
+        return self._check_available(udid, self.device_manager.get_device(udid))
+    
+    async def _resolve_available_device_async(self, target: Union[str, Dict]) -> Tuple[str, DeviceInfo]:
+        """Resolve a target and verify its device without blocking the event loop."""
+        if self.session_manager is None and isinstance(target, str) and self._looks_like_session_id(target):
+            # Standalone session lookup loads a session manager from disk
+            udid = await asyncio.to_thread(self._resolve_target, target)
+        else:
+            udid = self._resolve_target(target)
+        return udid, self._check_available(udid, await self.device_manager.get_device_async(udid))
+    
+    def _check_available(self, udid: str, device: Optional[DeviceInfo]) -> DeviceInfo:
+        """Verify a looked-up device exists and is booted/connected."""
+        logger.debug("Verifying device availability: %s", udid)
+        if not device:
+            raise DeviceNotAvailableError(f"Device not found: {udid}")
+        if device.state not in AVAILABLE_STATES:
             raise DeviceNotAvailableError(f"Device not available: {udid}")
-        self.logger.debug(f"Device {udid} is available")
+        logger.debug("Device %s is available", udid)
+        return device
     
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format."""
-        # Allow various URL schemes
-        patterns = [
-            r'^https?://.*',  # HTTP/HTTPS
-            r'^[a-zA-Z][a-zA-Z0-9+.-]*://',  # Custom schemes
-            r'^mailto:.*',  # Email
-            r'^tel:.*',  # Phone
-            r'^sms:.*',  # SMS
-        ]
+        if URL_PATTERN.match(url) is None:
+            return False
+        
+        # Deep links (custom schemes, mailto:, tel:, sms:) need nothing beyond the
+        # prefix match, so skip splitting the URL on that common path
+        if not url[:8].lower().startswith(WEB_URL_PREFIXES):
+            return True
+        
+        # Web URLs must also carry a well-formed host (and port, if any);
+        # validated per component so there is no regex backtracking over the whole URL
+        parts = urllib.parse.urlsplit(url)
+        
+        # urlsplit raises ValueError for a non-numeric or out-of-range (>65535) port
+        try:
+            port = parts.port
+        except ValueError:
+            return False
+        if port is not None and not 0 < port <= 65535:
+            return False
+        
+        return self._is_valid_hostname(parts.hostname)
+    
+    def _is_valid_hostname(self, hostname: Optional[str]) -> bool:
+        """Validate a hostname, IPv4/IPv6 address or localhost."""
+        if not hostname:
+            return False
+        if hostname == 'localhost':
+            return True
+        
+        try:
+            ipaddress.ip_address(hostname)
+            return True
+        except ValueError:
+            pass
         
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in patterns)
+        labels = hostname.rstrip('.').split('.')
+        return len(hostname) <= 253 and all(HOSTNAME_LABEL_PATTERN.fullmatch(label) for label in labels)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Simulator-specific implementations
@@ -725,12 +925,24 @@ class UnifiedUtilitiesManager(CommandExecutor):
     def _open_url_simulator(self, udid: str, url: str):
         """Open URL on simulator."""
         try:
-            self.logger.debug(f"Opening URL on simulator {udid}: {url}")
-            self.run_command(f"{self.simctl_path} openurl {udid} '{url}'")
-            self.logger.debug(f"Successfully opened URL on simulator")
+            logger.debug("Opening URL on simulator %s: %s", udid, url)
+            self.run_command(self._open_url_command_simulator(udid, url))
+            logger.debug("Successfully opened URL on simulator")
         except Exception as e:
             raise DeviceError(f"Failed to open URL on simulator: {e}")
     
+    def _open_url_command(self, device: DeviceInfo, udid: str, url: str) -> List[str]:
+        """Build the open-URL command for a device (shared by open_url and open_url_async)."""
+        if device.device_type == DeviceType.SIMULATOR:
+            return self._open_url_command_simulator(udid, url)
+        if not self.available_tools.get('idb'):
+            raise DeviceError("idb required for real device URL operations")
+        return self._open_url_command_real_device(udid, url)
+    
+    def _open_url_command_simulator(self, udid: str, url: str) -> List[str]:
+        """Build the simctl openurl command."""
+        return [*self.simctl_args, "openurl", udid, url]
+    
     def _get_permissions_simulator(self, udid: str, bundle_id: str) -> List[Permission]:
         """Get permissions on simulator."""
         permissions = []
@@ -740,26 +952,25 @@ class UnifiedUtilitiesManager(CommandExecutor):
         
         if tcc_db.exists():
             try:
-                conn = sqlite3.connect(str(tcc_db))
-                cursor = conn.cursor()
-                
-                # Query permissions
-                cursor.execute("""
-                    SELECT service, allowed FROM access 
-                    WHERE client = ? AND client_type = 0
-                """, (bundle_id,))
-                
-                for service, allowed in cursor.fetchall():
-                    permissions.append(Permission(
-                        name=service,
-                        service=service,
-                        status='granted' if allowed else 'denied',
-                        bundle_id=bundle_id
-                    ))
-                
-                conn.close()
+                # Read-only URI connection: no journal/lock setup, closed even on error
+                with closing(sqlite3.connect(f"{tcc_db.as_uri()}?mode=ro", uri=True)) as conn:
+                    # Query permissions, iterating the cursor instead of materializing fetchall()
+                    rows = conn.execute("""
+                        SELECT service, allowed FROM access 
+                        WHERE client = ? AND client_type = 0
+                    """, (bundle_id,))
+                    
+                    permissions = [
+                        Permission(
+                            name=service,
+                            service=service,
+                            status='granted' if allowed else 'denied',
+                            bundle_id=bundle_id
+                        )
+                        for service, allowed in rows
+                    ]
             except Exception as e:
-                print(f"Warning: Could not read permissions: {e}")
+                logger.warning("⚠️  Could not read permissions: %s", e)
         
         return permissions
     
@@ -767,7 +978,7 @@ class UnifiedUtilitiesManager(CommandExecutor):
                                  service: str, status: str):
         """Set permission on simulator."""
         try:
-            self.run_command(f"{self.simctl_path} privacy {udid} {status} {service} {bundle_id}")
+            self.run_command(self._simulator_permission_command(udid, bundle_id, service, status))
         except Exception as e:
             raise DeviceError(f"Failed to set permission: {e}")
     
@@ -775,108 +986,169 @@ class UnifiedUtilitiesManager(CommandExecutor):
         """Clear keychain on simulator."""
         keychain_dir = Path.home() / f"Library/Developer/CoreSimulator/Devices/{udid}/data/Library/Keychains"
         
-        if keychain_dir.exists():
-            try:
-                import shutil
-                shutil.rmtree(keychain_dir)
-                keychain_dir.mkdir()
-                print("✅ Keychain cleared")
-            except Exception as e:
-                raise DeviceError(f"Failed to clear keychain: {e}")
-        else:
-            print("⚠️  Keychain directory not found")
+        # rmtree stats the directory itself; no separate exists() probe
+        try:
+            import shutil
+            shutil.rmtree(keychain_dir)
+            keychain_dir.mkdir()
+            logger.info("✅ Keychain cleared")
+        except FileNotFoundError:
+            logger.warning("⚠️  Keychain directory not found")
+        except Exception as e:
+            raise DeviceError(f"Failed to clear keychain: {e}")
     
     def _get_simulator_info(self, udid: str) -> Dict[str, Any]:
-        """Get additional simulator info."""
+        """Get additional simulator info (runtime/device type never change for a UDID)."""
+        cached = self._simulator_info_cache.get(udid)
+        if cached is not None:
+            return dict(cached)
+        
         info = {}
         
         # Get device plist
         device_plist = Path.home() / f"Library/Developer/CoreSimulator/Devices/{udid}/device.plist"
         
-        if device_plist.exists():
-            try:
-                with open(device_plist, 'rb') as f:
-                    plist_data = plistlib.load(f)
-                
-                info['runtime'] = plist_data.get('runtime', '')
-                info['device_type'] = plist_data.get('deviceType', '')
-                
-            except Exception as e:
-                print(f"Warning: Could not read device plist: {e}")
+        # open() reports a missing plist itself; no separate exists() probe
+        try:
+            with open(device_plist, 'rb') as f:
+                plist_data = plistlib.load(f)
+            
+            info['runtime'] = plist_data.get('runtime', '')
+            info['device_type'] = plist_data.get('deviceType', '')
+            self._simulator_info_cache[udid] = dict(info)
+            
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("⚠️  Could not read device plist: %s", e)
         
         return info
     
     def _set_simulator_locale(self, udid: str, locale: str):
         """Set simulator locale."""
         # This would modify the simulator's GlobalPreferences.plist
-        print(f"Setting locale to {locale} (requires app restart)")
+        logger.info("Setting locale to %s (requires app restart)", locale)
     
     def _set_simulator_language(self, udid: str, language: str):
         """Set simulator language."""
         # This would modify the simulator's GlobalPreferences.plist
-        print(f"Setting language to {language} (requires app restart)")
+        logger.info("Setting language to %s (requires app restart)", language)
     
     def _set_simulator_timezone(self, udid: str, timezone: str):
         """Set simulator timezone."""
         try:
-            self.run_command(f"{self.simctl_path} spawn {udid} defaults write /System/Library/User\\ Template/English.lproj/Library/Preferences/.GlobalPreferences.plist timezone '{timezone}'")
-            print(f"✅ Timezone set to {timezone}")
+            self.run_command([
+                *self.simctl_args, "spawn", udid, "defaults", "write",
+                "/System/Library/User Template/English.lproj/Library/Preferences/.GlobalPreferences.plist",
+                "timezone", timezone
+            ])
+            logger.info("✅ Timezone set to %s", timezone)
         except:
-            print("⚠️  Could not set timezone")
+            logger.warning("⚠️  Could not set timezone")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Real device-specific implementations
     # ═══════════════════════════════════════════════════════════════════════════
     
+    def _ensure_idb_companion(self, udid: str):
+        """Register a long-lived idb companion for the device once per manager."""
+        if udid in self._idb_connected:
+            return
+        
+        # Without a companion idb still works per invocation, so a failed connect
+        # is only retried after IDB_CONNECT_RETRY_INTERVAL
+        failed_at = self._idb_connect_failures.get(udid)
+        if failed_at is not None and time.monotonic() - failed_at < IDB_CONNECT_RETRY_INTERVAL:
+            return
+        
+        try:
+            self.run_command([self.idb_path, "connect", udid], show_errors=False)
+        except Exception as e:
+            self._idb_connect_failures[udid] = time.monotonic()
+            logger.debug("idb connect failed for %s: %s", udid, e)
+            return
+        
+        self._idb_connect_failures.pop(udid, None)
+        if not self._idb_connected:
+            # First companion: make sure it is torn down when the process exits
+            atexit.register(self.close)
+        self._idb_connected.add(udid)
+    
+    def close(self):
+        """Disconnect idb companions registered by this manager."""
+        for udid in self._idb_connected:
+            try:
+                self.run_command([self.idb_path, "disconnect", udid], show_errors=False)
+            except Exception as e:
+                logger.debug("idb disconnect failed for %s: %s", udid, e)
+        self._idb_connected.clear()
+        atexit.unregister(self.close)
+    
     def _open_url_real_device(self, udid: str, url: str):
         """Open URL on real device."""
         if self.available_tools.get('idb'):
+            self._ensure_idb_companion(udid)
             try:
-                self.run_command(f"{self.idb_path} open --udid {udid} '{url}'")
+                self.run_command(self._open_url_command_real_device(udid, url))
             except Exception as e:
                 raise DeviceError(f"Failed to open URL: {e}")
         else:
             raise DeviceError("idb required for real device URL operations")
     
+    def _open_url_command_real_device(self, udid: str, url: str) -> List[str]:
+        """Build the idb open command."""
+        return [self.idb_path, "open", "--udid", udid, url]
+    
     def _get_permissions_real_device(self, udid: str, bundle_id: str) -> List[Permission]:
         """Get permissions on real device."""
         # Limited permission querying on real devices
-        print("⚠️  Permission querying limited on real devices")
+        logger.warning("⚠️  Permission querying limited on real devices")
         return []
     
     def _set_permission_real_device(self, udid: str, bundle_id: str,
                                    service: str, status: str):
         """Set permission on real device."""
         if self.available_tools.get('idb'):
+            self._ensure_idb_companion(udid)
             try:
                 # idb approve command
                 if status == 'grant':
-                    self.run_command(f"{self.idb_path} approve --udid {udid} {bundle_id} {service}")
+                    self.run_command(self._idb_approve_command(udid, bundle_id, (service,)))
                 else:
-                    print("⚠️  Permission denial not supported on real devices")
+                    logger.warning("⚠️  Permission denial not supported on real devices")
             except Exception as e:
                 raise DeviceError(f"Failed to set permission: {e}")
         else:
-            print("⚠️  Permission management requires idb for real devices")
+            logger.warning("⚠️  Permission management requires idb for real devices")
     
     def _clear_keychain_real_device(self, udid: str):
         """Clear keychain on real device."""
         if self.available_tools.get('idb'):
+            self._ensure_idb_companion(udid)
             try:
-                self.run_command(f"{self.idb_path} clear_keychain --udid {udid}")
+                self.run_command([self.idb_path, "clear_keychain", "--udid", udid])
             except:
-                print("⚠️  Keychain clearing not supported on this device")
+                logger.warning("⚠️  Keychain clearing not supported on this device")
         else:
-            print("⚠️  Keychain operations require idb for real devices")
+            logger.warning("⚠️  Keychain operations require idb for real devices")
     
     def _get_real_device_info(self, udid: str) -> Dict[str, Any]:
-        """Get additional real device info."""
+        """Get additional real device info (describe output reused for DESCRIBE_CACHE_TTL)."""
         info = {}
         
+        cached = self._describe_cache.get(udid)
+        if cached is not None and time.monotonic() - cached[0] < DESCRIBE_CACHE_TTL:
+            info.update(cached[1])
+            return info
+        
         if self.available_tools.get('idb'):
+            self._ensure_idb_companion(udid)
             try:
-                result = self.run_command(f"{self.idb_path} describe --udid {udid} --json")
-                device_data = json.loads(result.stdout)
+                # Parse the bytes directly instead of decoding stdout to str first
+                result = self.run_command([self.idb_path, "describe", "--udid", udid, "--json"],
+                                          text=False)
+                device_data = loads_json(result.stdout)
+                self._describe_cache[udid] = (time.monotonic(), device_data)
                 info.update(device_data)
             except:
                 pass
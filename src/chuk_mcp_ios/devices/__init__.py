@@ -6,13 +6,14 @@ iOS Device implementations module.
 Provides device-specific implementations for simulators and real devices.
 """
 
-from .simulator import SimulatorManager, SimulatorDevice
+from .simulator import SimulatorManager, SimulatorDevice, get_simulator_manager
 from .real_device import RealDeviceManager, RealDevice
 from .detector import DeviceDetector, UnifiedDevice
 
 __all__ = [
     'SimulatorManager',
     'SimulatorDevice',
+    'get_simulator_manager',
     'RealDeviceManager', 
     'RealDevice',
     'DeviceDetector',
@@ -16,7 +16,7 @@ from ..core.base import (
     DeviceState,
     detect_available_tools
 )
-from .simulator import SimulatorManager, SimulatorDevice
+from .simulator import SimulatorDevice, get_simulator_manager
 from .real_device import RealDeviceManager, RealDevice
 
 @dataclass
@@ -108,7 +108,7 @@ class DeviceDetector:
         
         # Initialize managers based on available tools
         if self.available_tools.get('simctl'):
-            self.simulator_manager = SimulatorManager()
+            self.simulator_manager = get_simulator_manager()
         
         if any(self.available_tools.get(tool) for tool in ['idb', 'devicectl', 'instruments']):
             self.real_device_manager = RealDeviceManager()
@@ -27,6 +27,12 @@ from ..core.base import (
     detect_available_tools
 )
 
+# One line of `instruments -s devices`: Name (iOS Version) [UDID]
+INSTRUMENTS_DEVICE_PATTERN = re.compile(
+    r'^(.+?)[ \t]*\(([^)]+)\)[ \t]*\[([A-F0-9-]{36,})\]',
+    re.MULTILINE
+)
+
 @dataclass
 class RealDevice:
     """Represents a real iOS device."""
@@ -455,29 +461,26 @@ class RealDeviceManager(CommandExecutor):
     def _discover_via_instruments(self, devices: Dict[str, RealDevice]) -> None:
         """Discover devices using instruments (legacy)."""
         try:
-            result = self.run_command("instruments -s devices", show_errors=False)
-            lines = result.stdout.split('\n')
+            result = self.run_command(["instruments", "-s", "devices"], show_errors=False)
             
-            for line in lines:
-                # Parse: iPhone Name (iOS Version) [UDID]
-                match = re.match(r'^(.+?)\s*\(([^)]+)\)\s*\[([A-F0-9-]{36,})\]', line)
-                if match:
-                    name = match.group(1).strip()
-                    ios_version = match.group(2).strip()
-                    udid = match.group(3).strip()
-                    
-                    # Skip simulators
-                    if 'Simulator' not in name and udid not in devices:
-                        devices[udid] = RealDevice(
-                            udid=udid,
-                            name=name,
-                            model=name,  # instruments doesn't provide model
-                            ios_version=ios_version,
-                            architecture='Unknown',
-                            connection_type='usb',
-                            is_connected=True,
-                            trusted=True
-                        )
+            # Parse: iPhone Name (iOS Version) [UDID] -- one pass over the whole output
+            for match in INSTRUMENTS_DEVICE_PATTERN.finditer(result.stdout):
+                name = match.group(1).strip()
+                ios_version = match.group(2).strip()
+                udid = match.group(3).strip()
+                
+                # Skip simulators
+                if 'Simulator' not in name and udid not in devices:
+                    devices[udid] = RealDevice(
+                        udid=udid,
+                        name=name,
+                        model=name,  # instruments doesn't provide model
+                        ios_version=ios_version,
+                        architecture='Unknown',
+                        connection_type='usb',
+                        is_connected=True,
+                        trusted=True
+                    )
         except Exception as e:
             # Silent failure - don't print warning during discovery
             pass
@@ -11,6 +11,8 @@ import json
 import time
 import plistlib
 import shutil
+import subprocess
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -26,6 +28,14 @@ from ..core.base import (
     DeviceNotAvailableError
 )
 
+# CoreSimulator device.plist state values
+PLIST_STATES = {
+    1: 'Shutdown',
+    2: 'Booting',
+    3: 'Booted',
+    4: 'Shutting Down'
+}
+
 @dataclass
 class SimulatorDevice:
     """Represents an iOS simulator device."""
@@ -79,43 +89,109 @@ class SimulatorManager(CommandExecutor):
         self.simulator_app_path = "/Applications/Xcode.app/Contents/Developer/Applications/Simulator.app"
         self._runtime_cache = None
         self._device_type_cache = None
+        self.devices_dir = Path.home() / "Library/Developer/CoreSimulator/Devices"
+        self.use_core_sim = os.environ.get('IOS_USE_CORE_SIM') == '1'
     
     # Device Discovery and Management
     
     def list_simulators(self, refresh: bool = False) -> List[SimulatorDevice]:
         """List all available simulators."""
+        if self.use_core_sim:
+            try:
+                return self._list_simulators_from_plists()
+            except Exception:
+                pass  # Fall back to simctl
+        
         try:
-            result = self.run_command(f"{self.simctl_path} list devices -j")
-            data = json.loads(result.stdout)
-            
-            simulators = []
-            for runtime, devices in data['devices'].items():
-                for device in devices:
-                    sim = SimulatorDevice(
-                        udid=device['udid'],
-                        name=device['name'],
-                        state=device['state'],
-                        runtime=runtime,
-                        device_type_identifier=device.get('deviceTypeIdentifier', ''),
-                        is_available=device.get('isAvailable', True)
-                    )
-                    
-                    # Add data paths
-                    sim.data_path = self._get_simulator_data_path(sim.udid)
-                    sim.log_path = self._get_simulator_log_path(sim.udid)
-                    
-                    simulators.append(sim)
-            
-            return simulators
-            
+            result = self.run_command([*self.simctl_args, "list", "devices", "-j"])
+            return self._parse_simulator_list(json.loads(result.stdout))
+        except Exception as e:
+            raise DeviceError(f"Failed to list simulators: {e}")
+    
+    async def list_simulators_async(self) -> List[SimulatorDevice]:
+        """List all available simulators without blocking the event loop."""
+        if self.use_core_sim:
+            try:
+                return self._list_simulators_from_plists()
+            except Exception:
+                pass  # Fall back to simctl
+        
+        try:
+            result = await self.run_command_async([*self.simctl_args, "list", "devices", "-j"])
+            return self._parse_simulator_list(json.loads(result.stdout))
         except Exception as e:
             raise DeviceError(f"Failed to list simulators: {e}")
     
+    def _parse_simulator_list(self, data: Dict[str, Any]) -> List[SimulatorDevice]:
+        """Build SimulatorDevice entries from 'simctl list devices -j' output."""
+        simulators = []
+        for runtime, devices in data['devices'].items():
+            for device in devices:
+                sim = SimulatorDevice(
+                    udid=device['udid'],
+                    name=device['name'],
+                    state=device['state'],
+                    runtime=runtime,
+                    device_type_identifier=device.get('deviceTypeIdentifier', ''),
+                    is_available=device.get('isAvailable', True)
+                )
+                
+                # Add data paths
+                sim.data_path = self._get_simulator_data_path(sim.udid)
+                sim.log_path = self._get_simulator_log_path(sim.udid)
+                
+                simulators.append(sim)
+        
+        return simulators
+    
+    def _list_simulators_from_plists(self) -> List[SimulatorDevice]:
+        """List simulators by reading CoreSimulator device.plist files directly."""
+        simulators = []
+        with os.scandir(self.devices_dir) as entries:
+            for entry in entries:
+                plist_path = os.path.join(entry.path, 'device.plist')
+                try:
+                    with open(plist_path, 'rb') as f:
+                        device = plistlib.load(f)
+                except (OSError, plistlib.InvalidFileException):
+                    continue
+                
+                if device.get('isDeleted'):
+                    continue
+                
+                udid = device['UDID']
+                simulators.append(SimulatorDevice(
+                    udid=udid,
+                    name=device['name'],
+                    state=PLIST_STATES.get(device.get('state'), 'Unknown'),
+                    runtime=device['runtime'],
+                    device_type_identifier=device.get('deviceType', ''),
+                    is_available=True,
+                    data_path=Path(entry.path),
+                    log_path=self._get_simulator_log_path(udid)
+                ))
+        
+        return simulators
+    
     def get_simulator(self, udid: str) -> Optional[SimulatorDevice]:
         """Get specific simulator by UDID."""
         simulators = self.list_simulators()
         return next((s for s in simulators if s.udid == udid), None)
     
+    def is_booted(self, udid: str) -> bool:
+        """
+        Check whether a single simulator is booted.
+        
+        Reads the simulator's device.plist (a few ms) instead of listing every
+        device through simctl; falls back to the listing if the plist is unreadable.
+        """
+        try:
+            with open(self.devices_dir / udid / 'device.plist', 'rb') as f:
+                return PLIST_STATES.get(plistlib.load(f).get('state')) == 'Booted'
+        except (OSError, plistlib.InvalidFileException):
+            simulator = self.get_simulator(udid)
+            return bool(simulator) and simulator.state == 'Booted'
+    
     def get_booted_simulators(self) -> List[SimulatorDevice]:
         """Get all booted simulators."""
         simulators = self.list_simulators()
@@ -159,7 +235,7 @@ class SimulatorManager(CommandExecutor):
     def delete_simulator(self, udid: str) -> None:
         """Delete a simulator."""
         try:
-            self.run_command(f"{self.simctl_path} delete {udid}")
+            self.run_command([*self.simctl_args, "delete", udid])
             print(f"✅ Deleted simulator: {udid}")
         except Exception as e:
             raise DeviceError(f"Failed to delete simulator: {e}")
@@ -201,25 +277,32 @@ class SimulatorManager(CommandExecutor):
         
         try:
             print(f"Booting {simulator.name}...")
-            self.run_command(f"{self.simctl_path} boot {udid}")
+            self.run_command([*self.simctl_args, "boot", udid])
             
-            # Wait for boot completion
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                sim = self.get_simulator(udid)
-                if sim and sim.state == 'Booted':
-                    # Open Simulator app
-                    self._open_simulator_app()
-                    time.sleep(2)  # Allow UI to settle
-                    print(f"✅ Simulator {simulator.name} booted successfully")
-                    return
-                time.sleep(1)
+            # Block until boot completes instead of polling the device list
+            self.wait_for_boot(udid, timeout)
             
-            raise DeviceError(f"Timeout waiting for simulator to boot")
+            # Open Simulator app (bootstatus has already confirmed the boot finished)
+            self._open_simulator_app()
+            print(f"✅ Simulator {simulator.name} booted successfully")
             
         except Exception as e:
             raise DeviceError(f"Failed to boot simulator: {e}")
     
+    def wait_for_boot(self, udid: str, timeout: int = 60, boot: bool = True) -> None:
+        """
+        Wait for a simulator to finish booting using simctl bootstatus.
+        
+        With boot=False this only waits for a boot started elsewhere.
+        """
+        command = [*self.simctl_args, "bootstatus", udid]
+        if boot:
+            command.append("-b")
+        try:
+            self.run_command(command, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            raise DeviceError(f"Timeout waiting for simulator to boot")
+    
     def shutdown_simulator(self, udid: str) -> None:
         """Shutdown a simulator."""
         simulator = self.get_simulator(udid)
@@ -231,7 +314,7 @@ class SimulatorManager(CommandExecutor):
             return
         
         try:
-            self.run_command(f"{self.simctl_path} shutdown {udid}")
+            self.run_command([*self.simctl_args, "shutdown", udid])
             print(f"✅ Simulator {simulator.name} shutdown")
         except Exception as e:
             raise DeviceError(f"Failed to shutdown simulator: {e}")
@@ -248,7 +331,7 @@ class SimulatorManager(CommandExecutor):
             time.sleep(2)
         
         try:
-            self.run_command(f"{self.simctl_path} erase {udid}")
+            self.run_command([*self.simctl_args, "erase", udid])
             print(f"✅ Simulator {simulator.name} erased")
         except Exception as e:
             raise DeviceError(f"Failed to erase simulator: {e}")
@@ -256,7 +339,7 @@ class SimulatorManager(CommandExecutor):
     def rename_simulator(self, udid: str, new_name: str) -> None:
         """Rename a simulator."""
         try:
-            self.run_command(f"{self.simctl_path} rename {udid} '{new_name}'")
+            self.run_command([*self.simctl_args, "rename", udid, new_name])
             print(f"✅ Simulator renamed to: {new_name}")
         except Exception as e:
             raise DeviceError(f"Failed to rename simulator: {e}")
@@ -265,20 +348,18 @@ class SimulatorManager(CommandExecutor):
     
     def take_screenshot(self, udid: str, output_path: str) -> str:
         """Take a screenshot of the simulator."""
-        simulator = self.get_simulator(udid)
-        if not simulator or simulator.state != 'Booted':
+        if not self.is_booted(udid):
             raise DeviceNotAvailableError("Simulator must be booted")
         
         try:
-            self.run_command(f"{self.simctl_path} io {udid} screenshot '{output_path}'")
+            self.run_command([*self.simctl_args, "io", udid, "screenshot", str(output_path)])
             return output_path
         except Exception as e:
             raise DeviceError(f"Failed to take screenshot: {e}")
     
     def record_video(self, udid: str, output_path: str, options: Optional[Dict[str, Any]] = None) -> None:
         """Start video recording (must be stopped manually)."""
-        simulator = self.get_simulator(udid)
-        if not simulator or simulator.state != 'Booted':
+        if not self.is_booted(udid):
             raise DeviceNotAvailableError("Simulator must be booted")
         
         try:
@@ -308,8 +389,7 @@ class SimulatorManager(CommandExecutor):
                       cellular_bars: Optional[int] = None,
                       wifi_bars: Optional[int] = None) -> None:
         """Override status bar appearance."""
-        simulator = self.get_simulator(udid)
-        if not simulator or simulator.state != 'Booted':
+        if not self.is_booted(udid):
             raise DeviceNotAvailableError("Simulator must be booted")
         
         try:
@@ -333,7 +413,7 @@ class SimulatorManager(CommandExecutor):
     def clear_status_bar(self, udid: str) -> None:
         """Clear status bar overrides."""
         try:
-            self.run_command(f"{self.simctl_path} status_bar {udid} clear")
+            self.run_command([*self.simctl_args, "status_bar", udid, "clear"])
             print("✅ Status bar cleared")
         except Exception as e:
             raise DeviceError(f"Failed to clear status bar: {e}")
@@ -391,7 +471,7 @@ class SimulatorManager(CommandExecutor):
             raise FileNotFoundError(f"App not found: {app_path}")
         
         try:
-            self.run_command(f"{self.simctl_path} install {udid} '{app_path}'")
+            self.run_command([*self.simctl_args, "install", udid, str(app_path)])
             print(f"✅ App installed: {os.path.basename(app_path)}")
         except Exception as e:
             raise DeviceError(f"Failed to install app: {e}")
@@ -399,7 +479,7 @@ class SimulatorManager(CommandExecutor):
     def uninstall_app(self, udid: str, bundle_id: str) -> None:
         """Uninstall an app from the simulator."""
         try:
-            self.run_command(f"{self.simctl_path} uninstall {udid} {bundle_id}")
+            self.run_command([*self.simctl_args, "uninstall", udid, bundle_id])
             print(f"✅ App uninstalled: {bundle_id}")
         except Exception as e:
             raise DeviceError(f"Failed to uninstall app: {e}")
@@ -419,7 +499,7 @@ class SimulatorManager(CommandExecutor):
     def terminate_app(self, udid: str, bundle_id: str) -> None:
         """Terminate an app on the simulator."""
         try:
-            self.run_command(f"{self.simctl_path} terminate {udid} {bundle_id}")
+            self.run_command([*self.simctl_args, "terminate", udid, bundle_id])
             print(f"✅ App terminated: {bundle_id}")
         except Exception as e:
             # App might not be running
@@ -531,7 +611,7 @@ class SimulatorManager(CommandExecutor):
     def _load_device_types(self) -> None:
         """Load available device types."""
         try:
-            result = self.run_command(f"{self.simctl_path} list devicetypes -j")
+            result = self.run_command([*self.simctl_args, "list", "devicetypes", "-j"])
             data = json.loads(result.stdout)
             self._device_type_cache = data.get('devicetypes', [])
         except:
@@ -540,7 +620,7 @@ class SimulatorManager(CommandExecutor):
     def _load_runtimes(self) -> None:
         """Load available runtimes."""
         try:
-            result = self.run_command(f"{self.simctl_path} list runtimes -j")
+            result = self.run_command([*self.simctl_args, "list", "runtimes", "-j"])
             data = json.loads(result.stdout)
             self._runtime_cache = data.get('runtimes', [])
         except:
@@ -588,4 +668,9 @@ class SimulatorManager(CommandExecutor):
             battery_level=100,
             cellular_bars=4,
             wifi_bars=3
-        )
\ No newline at end of file
+        )
+
+@lru_cache(maxsize=1)
+def get_simulator_manager() -> SimulatorManager:
+    """Return the process-wide SimulatorManager (shares runtime/device type caches)."""
+    return SimulatorManager()
@@ -188,9 +188,10 @@ class ScreenshotInput(BaseModel):
 class ScreenshotResult(BaseModel):
     """Screenshot result."""
     success: bool = Field(..., description="Success status")
-    file_path: str = Field(..., description="Screenshot file path")
+    file_path: Optional[str] = Field(None, description="Screenshot file path (None when only data was requested)")
     file_size: int = Field(..., description="File size in bytes")
     timestamp: str = Field(..., description="Capture timestamp")
+    data: Optional[str] = Field(None, description="Base64-encoded PNG data (when requested)")
 
 class RecordVideoInput(BaseModel):
     """Record video input."""
@@ -297,4 +298,5 @@ class ErrorResult(BaseModel):
     """Error result."""
     error: str = Field(..., description="Error message")
     details: Optional[str] = Field(None, description="Error details")
-    code: Optional[str] = Field(None, description="Error code")
\ No newline at end of file
+    code: Optional[str] = Field(None, description="Error code")
+    truncated: bool = Field(False, description="Whether the error message was truncated")
\ No newline at end of file
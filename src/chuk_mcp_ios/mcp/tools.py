@@ -7,7 +7,11 @@ FIXED: Renamed session_id parameters to ios_session_id to avoid MCP runtime vali
 """
 
 import os
+import atexit
+import base64
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -15,17 +19,29 @@ from pathlib import Path
 # chuk runtime
 from chuk_mcp_runtime.common.mcp_tool_decorator import mcp_tool
 
-# CHUK Sessions integration
-from chuk_sessions import SessionManager
-
 # models
-from .models import *
+from .models import (
+    CreateSessionResult,
+    SessionInfoResult,
+    ListSessionsResult,
+    DeviceInfo,
+    ListDevicesResult,
+    DeviceOperationResult,
+    AppInfo,
+    AppOperationResult,
+    ScreenshotResult,
+    ScreenInfo,
+    MediaOperationResult,
+    LogEntry,
+    LogsResult,
+    ErrorResult
+)
 
 # Import iOS control managers
 from chuk_mcp_ios.core.device_manager import UnifiedDeviceManager
 from chuk_mcp_ios.core.session_manager import UnifiedSessionManager, SessionConfig
 from chuk_mcp_ios.core.app_manager import UnifiedAppManager, AppInstallConfig
-from chuk_mcp_ios.core.ui_controller import UnifiedUIController
+from chuk_mcp_ios.core.ui_controller import UnifiedUIController, VALID_BUTTONS, SWIPE_DIRECTIONS
 from chuk_mcp_ios.core.media_manager import UnifiedMediaManager
 from chuk_mcp_ios.core.utilities_manager import UnifiedUtilitiesManager
 from chuk_mcp_ios.core.logger_manager import UnifiedLoggerManager, LogFilter
@@ -34,18 +50,28 @@ from chuk_mcp_ios.core.logger_manager import UnifiedLoggerManager, LogFilter
 # CHUK SESSIONS INTEGRATION
 # ═══════════════════════════════════════════════════════════════════════════
 
-# Initialize CHUK Sessions manager with proper error handling
+# CHUK Sessions is imported and initialized on first use to keep module import cheap
 os.environ.setdefault('SESSION_PROVIDER', 'memory')
 
-try:
-    ios_session_manager = SessionManager(
-        sandbox_id="ios-device-control",
-        default_ttl_hours=24
-    )
-    print("🔐 CHUK Sessions manager initialized successfully")
-except Exception as e:
-    print(f"❌ Failed to initialize CHUK Sessions: {e}")
-    ios_session_manager = None
+_ios_session_manager = None
+_ios_session_manager_initialized = False
+
+def get_ios_session_manager():
+    """Get the CHUK Sessions manager, or None if it could not be initialized."""
+    global _ios_session_manager, _ios_session_manager_initialized
+    if not _ios_session_manager_initialized:
+        _ios_session_manager_initialized = True
+        try:
+            from chuk_sessions import SessionManager
+            _ios_session_manager = SessionManager(
+                sandbox_id="ios-device-control",
+                default_ttl_hours=24
+            )
+            print("🔐 CHUK Sessions manager initialized successfully")
+        except Exception as e:
+            print(f"❌ Failed to initialize CHUK Sessions: {e}")
+            _ios_session_manager = None
+    return _ios_session_manager
 
 # Store session metadata separately since CHUK Sessions manages its own IDs
 _ios_session_registry: Dict[str, Dict[str, Any]] = {}
@@ -56,6 +82,7 @@ _ios_session_registry: Dict[str, Dict[str, Any]] = {}
 
 _device_manager: Optional[UnifiedDeviceManager] = None
 _unified_session_manager: Optional[UnifiedSessionManager] = None
+_session_scoped_managers: Dict[type, Any] = {}
 
 def get_device_manager() -> UnifiedDeviceManager:
     """Get device manager instance."""
@@ -69,7 +96,8 @@ def get_unified_session_manager() -> UnifiedSessionManager:
     global _unified_session_manager
     if _unified_session_manager is None:
         print("🔧 Creating singleton UnifiedSessionManager")
-        _unified_session_manager = UnifiedSessionManager()
+        # Share the device manager so session and device tools hit one device cache
+        _unified_session_manager = UnifiedSessionManager(device_manager=get_device_manager())
     return _unified_session_manager
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -92,6 +120,7 @@ async def register_ios_session(session_id: str, device_info: Dict[str, Any], ios
     """Register an iOS session using CHUK Sessions for persistence."""
     global _ios_session_registry
     
+    ios_session_manager = get_ios_session_manager()
     if not ios_session_manager:
         print("❌ CHUK Sessions not available")
         return False
@@ -139,6 +168,7 @@ async def unregister_ios_session(session_id: str):
         registry_entry = _ios_session_registry.get(session_id)
         
         # Delete from CHUK Sessions if available
+        ios_session_manager = get_ios_session_manager()
         if ios_session_manager and registry_entry:
             chuk_session_id = registry_entry.get('chuk_session_id')
             if chuk_session_id:
@@ -164,23 +194,49 @@ async def get_manager_for_session(session_id: str, manager_class):
     if not await simple_session_validation(session_id):
         raise Exception(f"Session {session_id} is invalid or expired")
     
-    # Get the singleton UnifiedSessionManager
-    unified_session_manager = get_unified_session_manager()
-    
-    # Create manager instance
-    manager = manager_class()
-    
-    # Configure manager if it supports session management
-    if hasattr(manager, 'set_session_manager'):
-        manager.set_session_manager(unified_session_manager)
-        print(f"🔧 {manager_class.__name__} configured for session {session_id}")
+    # Reuse one manager per class; constructing one probes tools and lists devices
+    manager = _session_scoped_managers.get(manager_class)
+    if manager is None:
+        manager = manager_class()
+        
+        # Share the device cache so boots done through sessions are visible here
+        if hasattr(manager, 'device_manager'):
+            manager.device_manager = get_device_manager()
+        
+        # Configure manager if it supports session management
+        if hasattr(manager, 'set_session_manager'):
+            manager.set_session_manager(get_unified_session_manager())
+            print(f"🔧 {manager_class.__name__} configured for session management")
+        
+        _session_scoped_managers[manager_class] = manager
     
     return manager
 
+def operation_result(message: str, data: Optional[Dict[str, Any]] = None) -> Dict:
+    """Build an OperationResult-shaped success dict without a pydantic round trip."""
+    return {"success": True, "message": message, "data": data}
+
+# Cap on error text returned to MCP hosts; subprocess stderr can be arbitrarily long
+MAX_ERROR_LENGTH = 512
+
+def error_result(e: Exception) -> Dict:
+    """Build a bounded ErrorResult dict from an exception."""
+    message = str(e)
+    truncated = len(message) > MAX_ERROR_LENGTH
+    return ErrorResult(
+        error=message[:MAX_ERROR_LENGTH],
+        code=type(e).__name__,
+        truncated=truncated
+    ).model_dump()
+
+# Dedicated pool for blocking simctl/idb work, sized for concurrent tool calls
+_executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="ios-device")
+atexit.register(_executor.shutdown, wait=False)
+
 async def run_sync(func, *args, **kwargs):
     """Run sync function in thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SESSION MANAGEMENT TOOLS
@@ -223,7 +279,7 @@ async def ios_create_session(
         
         # Create session
         try:
-            session_id = await run_sync(unified_session_manager.create_session, config)
+            session_id = await unified_session_manager.create_session_async(config, executor=_executor)
             print(f"🎯 Session created in singleton manager: {session_id}")
         except Exception as e:
             return {"error": f"Failed to create session: {e}"}
@@ -251,7 +307,7 @@ async def ios_create_session(
             "platform_version": info.get('os_version', 'Unknown'),
             "state": info['current_state'],
             "registered_with_chuk": chuk_registered,
-            "chuk_available": ios_session_manager is not None
+            "chuk_available": get_ios_session_manager() is not None
         }
         
     except Exception as e:
@@ -267,35 +323,32 @@ async def ios_list_sessions() -> Dict:
     try:
         # Get sessions from the singleton UnifiedSessionManager
         unified_manager = get_unified_session_manager()
-        session_ids = await run_sync(unified_manager.list_sessions)
-        print(f"📋 Found {len(session_ids)} sessions in singleton manager")
-        
-        sessions = []
-        for session_id in session_ids:
-            try:
-                info = await run_sync(unified_manager.get_session_info, session_id)
-                
-                sessions.append(SessionInfoResult(
-                    session_id=session_id,
-                    device_name=info.get('device_name', 'Unknown'),
-                    udid=info.get('device_udid', 'Unknown'),
-                    device_type=info.get('device_type', 'Unknown'),
-                    state=info.get('current_state', 'unknown'),
-                    platform_version=info.get('os_version', 'Unknown'),
-                    created_at=info.get('created_at', ''),
-                    is_available=info.get('is_available', False)
-                ))
-            except Exception as e:
-                print(f"Warning: Could not get info for session {session_id}: {e}")
+        # One device listing for all sessions instead of a lookup per session
+        infos = await run_sync(unified_manager.get_sessions_info)
+        print(f"📋 Found {len(infos)} sessions in singleton manager")
+        
+        sessions = [
+            SessionInfoResult(
+                session_id=session_id,
+                device_name=info.get('device_name', 'Unknown'),
+                udid=info.get('device_udid', 'Unknown'),
+                device_type=info.get('device_type', 'Unknown'),
+                state=info.get('current_state', 'unknown'),
+                platform_version=info.get('os_version', 'Unknown'),
+                created_at=info.get('created_at', ''),
+                is_available=info.get('is_available', False)
+            )
+            for session_id, info in infos.items()
+        ]
         
         return ListSessionsResult(
             sessions=sessions,
             total_count=len(sessions),
-            chuk_sessions_available=ios_session_manager is not None
+            chuk_sessions_available=get_ios_session_manager() is not None
         ).model_dump()
         
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_terminate_session",
@@ -316,13 +369,10 @@ async def ios_terminate_session(ios_session_id: str) -> Dict:
         # Remove from CHUK Sessions and registry
         await unregister_ios_session(ios_session_id)
         
-        return OperationResult(
-            success=True,
-            message=f"Session {ios_session_id} terminated successfully"
-        ).model_dump()
+        return operation_result(f"Session {ios_session_id} terminated successfully")
         
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_create_automation_session", 
@@ -359,7 +409,7 @@ async def ios_create_automation_session(
             state=info['current_state']
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_session_status",
@@ -383,13 +433,13 @@ async def ios_session_status(ios_session_id: str) -> Dict:
         return {
             "session_id": ios_session_id,
             "in_unified_manager": in_unified,
-            "chuk_sessions_available": ios_session_manager is not None,
+            "chuk_sessions_available": get_ios_session_manager() is not None,
             "unified_info": unified_info,
             "overall_valid": in_unified
         }
         
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # DEVICE MANAGEMENT (no session required)
@@ -404,7 +454,7 @@ async def ios_list_devices() -> Dict:
     """List available devices."""
     try:
         device_manager = get_device_manager()
-        devices = await run_sync(device_manager.discover_all_devices)
+        devices = await device_manager.discover_all_devices_async()
         
         device_list = []
         simulators = 0
@@ -440,7 +490,7 @@ async def ios_list_devices() -> Dict:
             available_count=available_count
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_boot_device",
@@ -475,7 +525,7 @@ async def ios_boot_device(udid: str, timeout: int = 60) -> Dict:
             device_info=device_info
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_shutdown_device",
@@ -493,7 +543,7 @@ async def ios_shutdown_device(udid: str) -> Dict:
             message=f"Device {udid} shutdown successfully"
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # APP MANAGEMENT - FIXED WITH ios_session_id PARAMETER
@@ -534,7 +584,7 @@ async def ios_install_app(
             )
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_launch_app",
@@ -554,12 +604,9 @@ async def ios_launch_app(
         app_manager = await get_manager_for_session(ios_session_id, UnifiedAppManager)
         await run_sync(app_manager.launch_app, ios_session_id, bundle_id, arguments)
         
-        return OperationResult(
-            success=True,
-            message=f"App {bundle_id} launched"
-        ).model_dump()
+        return operation_result(f"App {bundle_id} launched")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_terminate_app",
@@ -575,12 +622,9 @@ async def ios_terminate_app(ios_session_id: str, bundle_id: str) -> Dict:
         app_manager = await get_manager_for_session(ios_session_id, UnifiedAppManager)
         await run_sync(app_manager.terminate_app, ios_session_id, bundle_id)
         
-        return OperationResult(
-            success=True,
-            message=f"App {bundle_id} terminated"
-        ).model_dump()
+        return operation_result(f"App {bundle_id} terminated")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_uninstall_app",
@@ -596,12 +640,9 @@ async def ios_uninstall_app(ios_session_id: str, bundle_id: str) -> Dict:
         app_manager = await get_manager_for_session(ios_session_id, UnifiedAppManager)
         await run_sync(app_manager.uninstall_app, ios_session_id, bundle_id)
         
-        return OperationResult(
-            success=True,
-            message=f"App {bundle_id} uninstalled"
-        ).model_dump()
+        return operation_result(f"App {bundle_id} uninstalled")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_list_apps",
@@ -617,28 +658,24 @@ async def ios_list_apps(ios_session_id: str, user_apps_only: bool = True) -> Dic
         app_manager = await get_manager_for_session(ios_session_id, UnifiedAppManager)
         apps = await run_sync(app_manager.list_apps, ios_session_id, user_apps_only)
         
-        app_list = []
-        user_count = 0
-        
-        for app in apps:
-            app_info = AppInfo(
-                bundle_id=app.bundle_id,
-                name=app.name,
-                version=app.version,
-                installed_path=app.installed_path
-            )
-            app_list.append(app_info)
-            
-            if not app.bundle_id.startswith('com.apple.'):
-                user_count += 1
+        app_list = [
+            {
+                "bundle_id": app.bundle_id,
+                "name": app.name,
+                "version": app.version,
+                "installed_path": app.installed_path
+            }
+            for app in apps
+        ]
+        user_count = sum(1 for app in apps if not app.bundle_id.startswith('com.apple.'))
         
-        return ListAppsResult(
-            apps=app_list,
-            total_count=len(app_list),
-            user_app_count=user_count
-        ).model_dump()
+        return {
+            "apps": app_list,
+            "total_count": len(app_list),
+            "user_app_count": user_count
+        }
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # UI INTERACTIONS - FIXED WITH ios_session_id PARAMETER
@@ -658,12 +695,9 @@ async def ios_tap(ios_session_id: str, x: int, y: int) -> Dict:
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         await run_sync(ui_controller.tap, ios_session_id, x, y)
         
-        return OperationResult(
-            success=True,
-            message=f"Tapped at ({x}, {y})"
-        ).model_dump()
+        return operation_result(f"Tapped at ({x}, {y})")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_double_tap",
@@ -679,12 +713,9 @@ async def ios_double_tap(ios_session_id: str, x: int, y: int) -> Dict:
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         await run_sync(ui_controller.double_tap, ios_session_id, x, y)
         
-        return OperationResult(
-            success=True,
-            message=f"Double tapped at ({x}, {y})"
-        ).model_dump()
+        return operation_result(f"Double tapped at ({x}, {y})")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_long_press",
@@ -705,12 +736,9 @@ async def ios_long_press(
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         await run_sync(ui_controller.long_press, ios_session_id, x, y, duration)
         
-        return OperationResult(
-            success=True,
-            message=f"Long pressed at ({x}, {y}) for {duration}s"
-        ).model_dump()
+        return operation_result(f"Long pressed at ({x}, {y}) for {duration}s")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_swipe",
@@ -733,12 +761,9 @@ async def ios_swipe(
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         await run_sync(ui_controller.swipe, ios_session_id, start_x, start_y, end_x, end_y, duration)
         
-        return OperationResult(
-            success=True,
-            message=f"Swiped from ({start_x}, {start_y}) to ({end_x}, {end_y})"
-        ).model_dump()
+        return operation_result(f"Swiped from ({start_x}, {start_y}) to ({end_x}, {end_y})")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_swipe_direction",
@@ -756,25 +781,15 @@ async def ios_swipe_direction(
         if not await simple_session_validation(ios_session_id):
             return ErrorResult(error=f"Session {ios_session_id} is invalid").model_dump()
         
-        ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
-        
-        if direction == "up":
-            await run_sync(ui_controller.swipe_up, ios_session_id, distance, duration)
-        elif direction == "down":
-            await run_sync(ui_controller.swipe_down, ios_session_id, distance, duration)
-        elif direction == "left":
-            await run_sync(ui_controller.swipe_left, ios_session_id, distance, duration)
-        elif direction == "right":
-            await run_sync(ui_controller.swipe_right, ios_session_id, distance, duration)
-        else:
+        if direction not in SWIPE_DIRECTIONS:
             return ErrorResult(error=f"Invalid direction: {direction}").model_dump()
         
-        return OperationResult(
-            success=True,
-            message=f"Swiped {direction}"
-        ).model_dump()
+        ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
+        await run_sync(ui_controller.swipe_direction, ios_session_id, direction, distance, duration)
+        
+        return operation_result(f"Swiped {direction}")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_input_text",
@@ -790,12 +805,9 @@ async def ios_input_text(ios_session_id: str, text: str) -> Dict:
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         await run_sync(ui_controller.input_text, ios_session_id, text)
         
-        return OperationResult(
-            success=True,
-            message=f"Input text: {text[:50]}{'...' if len(text) > 50 else ''}"
-        ).model_dump()
+        return operation_result(f"Input text: {text[:50]}{'...' if len(text) > 50 else ''}")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_press_button",
@@ -805,18 +817,21 @@ async def ios_input_text(ios_session_id: str, text: str) -> Dict:
 async def ios_press_button(ios_session_id: str, button: str) -> Dict:
     """Press button."""
     try:
+        # Reject unknown buttons before any session or device work
+        if button not in VALID_BUTTONS:
+            return ErrorResult(
+                error=f"Invalid button: {button}. Valid: {', '.join(sorted(VALID_BUTTONS))}"
+            ).model_dump()
+        
         if not await simple_session_validation(ios_session_id):
             return ErrorResult(error=f"Session {ios_session_id} is invalid").model_dump()
         
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         await run_sync(ui_controller.press_button, ios_session_id, button)
         
-        return OperationResult(
-            success=True,
-            message=f"Pressed {button} button"
-        ).model_dump()
+        return operation_result(f"Pressed {button} button")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_screenshot",
@@ -825,7 +840,8 @@ async def ios_press_button(ios_session_id: str, button: str) -> Dict:
 )
 async def ios_screenshot(
     ios_session_id: str,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    return_bytes: bool = False
 ) -> Dict:
     """Take screenshot."""
     try:
@@ -834,25 +850,47 @@ async def ios_screenshot(
         
         ui_controller = await get_manager_for_session(ios_session_id, UnifiedUIController)
         
+        # One clock read serves both the default file name and the result timestamp
+        now = datetime.now()
+        
+        # Bytes without a path: stream the PNG over a pipe, no file round trip
+        if return_bytes and not output_path:
+            png = await run_sync(ui_controller.take_screenshot_bytes, ios_session_id)
+            return ScreenshotResult(
+                success=True,
+                file_path=None,
+                file_size=len(png),
+                timestamp=now.isoformat(),
+                data=base64.b64encode(png).decode('ascii')
+            ).model_dump()
+        
         # Generate path if not provided
         if not output_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"screenshot_{timestamp}.png"
+            output_path = f"screenshot_{now:%Y%m%d_%H%M%S}.png"
         
         result = await run_sync(ui_controller.take_screenshot, ios_session_id, output_path)
         
-        # Get file info
+        # Get file info with a single stat
         file_path = result if isinstance(result, str) else output_path
-        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            file_size = 0
+        
+        # Optionally inline the image so clients need no second file read
+        data = None
+        if return_bytes and file_size:
+            data = base64.b64encode(Path(file_path).read_bytes()).decode('ascii')
         
         return ScreenshotResult(
             success=True,
             file_path=file_path,
             file_size=file_size,
-            timestamp=datetime.now().isoformat()
+            timestamp=now.isoformat(),
+            data=data
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_record_video",
@@ -884,13 +922,9 @@ async def ios_record_video(
             options
         )
         
-        return OperationResult(
-            success=True,
-            message=f"Video recorded: {output_path}",
-            data={"file_path": result}
-        ).model_dump()
+        return operation_result(f"Video recorded: {output_path}", {"file_path": result})
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_get_screen_info",
@@ -913,7 +947,7 @@ async def ios_get_screen_info(ios_session_id: str) -> Dict:
             orientation=screen_info.orientation
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # LOCATION & MEDIA - FIXED WITH ios_session_id PARAMETER
@@ -938,12 +972,9 @@ async def ios_set_location(
         media_manager = await get_manager_for_session(ios_session_id, UnifiedMediaManager)
         await run_sync(media_manager.set_location, ios_session_id, latitude, longitude, altitude)
         
-        return OperationResult(
-            success=True,
-            message=f"Location set to {latitude}, {longitude}"
-        ).model_dump()
+        return operation_result(f"Location set to {latitude}, {longitude}")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_set_location_by_name",
@@ -959,12 +990,9 @@ async def ios_set_location_by_name(ios_session_id: str, location_name: str) -> D
         media_manager = await get_manager_for_session(ios_session_id, UnifiedMediaManager)
         await run_sync(media_manager.set_location_by_name, ios_session_id, location_name)
         
-        return OperationResult(
-            success=True,
-            message=f"Location set to {location_name}"
-        ).model_dump()
+        return operation_result(f"Location set to {location_name}")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_add_media",
@@ -987,7 +1015,7 @@ async def ios_add_media(ios_session_id: str, media_paths: List[str]) -> Dict:
             message=f"Added {len(added_files)} media files"
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # UTILITIES - FIXED WITH ios_session_id PARAMETER
@@ -1007,28 +1035,18 @@ async def ios_open_url(ios_session_id: str, url: str) -> Dict:
         if not await simple_session_validation(ios_session_id):
             return ErrorResult(error=f"Session {ios_session_id} is invalid").model_dump()
         
-        print(f"✅ Session {ios_session_id} validated in singleton manager")
-        
-        # Get utilities manager using singleton
-        unified_manager = get_unified_session_manager()
-        utilities = UnifiedUtilitiesManager()
-        utilities.set_session_manager(unified_manager)
-        
-        print(f"🔧 Utilities manager configured with singleton")
+        utilities = await get_manager_for_session(ios_session_id, UnifiedUtilitiesManager)
         
         # Open URL
         await run_sync(utilities.open_url, ios_session_id, url)
         
         print(f"✅ Successfully opened URL: {url}")
         
-        return OperationResult(
-            success=True,
-            message=f"Opened {url}"
-        ).model_dump()
+        return operation_result(f"Opened {url}")
         
     except Exception as e:
         print(f"❌ ios_open_url failed: {e}")
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_get_logs",
@@ -1075,7 +1093,7 @@ async def ios_get_logs(
             filtered_count=len(entries)
         ).model_dump()
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_set_permission",
@@ -1096,12 +1114,9 @@ async def ios_set_permission(
         utilities = await get_manager_for_session(ios_session_id, UnifiedUtilitiesManager)
         await run_sync(utilities.set_permission, ios_session_id, bundle_id, service, status)
         
-        return OperationResult(
-            success=True,
-            message=f"Set {service} permission to {status} for {bundle_id}"
-        ).model_dump()
+        return operation_result(f"Set {service} permission to {status} for {bundle_id}")
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
+        return error_result(e)
 
 @mcp_tool(
     name="ios_focus_simulator",
@@ -1117,9 +1132,60 @@ async def ios_focus_simulator(ios_session_id: str) -> Dict:
         utilities = await get_manager_for_session(ios_session_id, UnifiedUtilitiesManager)
         await run_sync(utilities.focus_simulator, ios_session_id)
         
-        return OperationResult(
-            success=True,
-            message="Simulator window focused"
-        ).model_dump()
+        return operation_result("Simulator window focused")
+    except Exception as e:
+        return error_result(e)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BATCH EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Read-only tools whose results do not depend on each other's ordering
+# (ios_screenshot is excluded: it writes a timestamped file, so concurrent calls collide)
+_BATCH_TOOLS = {
+    "ios_list_devices": ios_list_devices,
+    "ios_list_sessions": ios_list_sessions,
+    "ios_session_status": ios_session_status,
+    "ios_list_apps": ios_list_apps,
+    "ios_get_screen_info": ios_get_screen_info,
+    "ios_get_logs": ios_get_logs,
+}
+
+@mcp_tool(
+    name="ios_batch",
+    description="Run several independent read-only iOS tools concurrently "
+                f"({', '.join(_BATCH_TOOLS)}). Each call is {{'tool': name, 'args': {{...}}}}",
+    timeout=60
+)
+async def ios_batch(calls: List[Dict[str, Any]]) -> Dict:
+    """Run independent tool calls concurrently and return all results in order."""
+    async def run_call(call: Any) -> Dict:
+        # Malformed calls become per-call errors instead of failing the whole batch
+        try:
+            if not isinstance(call, dict):
+                raise TypeError(f"Batch call must be an object, got {type(call).__name__}")
+            tool_name = call.get("tool")
+            tool = _BATCH_TOOLS.get(tool_name) if isinstance(tool_name, str) else None
+            if tool is None:
+                return ErrorResult(error=f"Tool not allowed in batch: {tool_name}").model_dump()
+            args = call.get("args") or {}
+            if not isinstance(args, dict):
+                raise TypeError(f"Batch call args must be an object, got {type(args).__name__}")
+            return await tool(**args)
+        except Exception as e:
+            return error_result(e)
+    
+    try:
+        if not isinstance(calls, list):
+            raise TypeError(f"calls must be a list, got {type(calls).__name__}")
+        results = await asyncio.gather(*(run_call(call) for call in calls))
+        
+        return {
+            "results": [
+                {"tool": call.get("tool") if isinstance(call, dict) else None, "result": result}
+                for call, result in zip(calls, results)
+            ],
+            "total_count": len(results)
+        }
     except Exception as e:
-        return ErrorResult(error=str(e)).model_dump()
\ No newline at end of file
+        return error_result(e)